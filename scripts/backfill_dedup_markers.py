@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+Backfill dedup markers for images stored before atomic dedup writes.
+
+Once this has completed for a stage, DEDUP_LEGACY_CHECK can be removed
+from the upload function's environment.
+
+Run:
+    IMAGE_METADATA_TABLE_NAME=<table> PYTHONPATH=src \
+      poetry run python scripts/backfill_dedup_markers.py
+"""
+
+from aws_lambda_powertools import Logger
+
+from core.infrastructure.aws.dynamodb_metadata import DynamoDBMetadata
+
+logger = Logger(service="backfill-dedup-markers")
+
+
+def backfill_dedup_markers() -> None:
+    written = DynamoDBMetadata().backfill_dedup_markers()
+    logger.info("Backfill complete", extra={"markers_written": written})
+
+
+if __name__ == "__main__":
+    backfill_dedup_markers()
@@ -10,16 +10,25 @@ Run:
 """
 
 import argparse
+import asyncio
 import sys
 from typing import Any, cast
 
+import aiohttp
 from aws_lambda_powertools import Logger
-import requests
 
 logger = Logger(service="cleanup")
 
 BASE_API_URL = "http://localhost:4566/restapis/{0}/snd/_user_request_/v1/images"
 
+# Upper bound on in-flight deletes so LocalStack is not overwhelmed
+MAX_CONCURRENT_DELETES = 32
+REQUEST_TIMEOUT_SECONDS = 30
+KEEPALIVE_TIMEOUT_SECONDS = 30
+
+# Cap on failed ids included in the summary log entry
+MAX_LOGGED_FAILED_IDS = 100
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Cleanup seeded images via Image Storage API")
@@ -43,66 +52,103 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def cleanup_images() -> None:
-    try:
-        args = parse_args()
+async def delete_image(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    *,
+    base_url: str,
+    image_id: str,
+) -> bool:
+    """Delete a single image and return whether it succeeded.
 
-        headers: dict[str, str] = {}
-        if args.api_key:
-            headers["x-api-key"] = args.api_key
+    Successes are only logged at debug level; the caller emits a summary.
+    """
+    async with semaphore:
+        async with session.delete(f"{base_url}/{image_id}") as delete_resp:
+            if delete_resp.ok:
+                logger.debug("Deleted image", extra={"image_id": image_id})
+                return True
 
-        base_url = BASE_API_URL.format(args.api_id)
+            logger.error(
+                "Failed to delete image",
+                extra={
+                    "image_id": image_id,
+                    "status": delete_resp.status,
+                    "response": await delete_resp.text(),
+                },
+            )
+            return False
 
-        logger.info(
-            "Starting cleanup process",
-            extra={"api_base_url": base_url, "user_id": args.user_id},
-        )
 
+async def _cleanup(args: argparse.Namespace) -> None:
+    headers: dict[str, str] = {}
+    if args.api_key:
+        headers["x-api-key"] = args.api_key
+
+    base_url = BASE_API_URL.format(args.api_id)
+
+    logger.info(
+        "Starting cleanup process",
+        extra={"api_base_url": base_url, "user_id": args.user_id},
+    )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_DELETES)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+
+    # One keep-alive pool sized to the concurrency cap: every request reuses
+    # an already-open connection instead of paying a fresh TCP handshake.
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_DELETES,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+    )
+
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector) as session:
         # List images for user
-        response = requests.get(
-            base_url,
-            headers=headers,
-            params={"user_id": args.user_id},
-            timeout=30,
-        )
+        async with session.get(base_url, params={"user_id": args.user_id}) as response:
+            if not response.ok:
+                logger.error(
+                    "Failed to list images",
+                    extra={"status": response.status, "response": await response.text()},
+                )
+                sys.exit(1)
 
-        if not response.ok:
-            logger.error(
-                "Failed to list images",
-                extra={"status": response.status_code, "response": response.text},
-            )
-            sys.exit(1)
+            response_json = cast(dict[str, Any], await response.json(content_type=None))
 
-        response_json = cast(dict[str, Any], response.json())
         images = cast(list[dict[str, Any]], response_json.get("images", []))
 
         if not images:
             logger.info("No images found for cleanup")
             return
 
-        for image in images:
-            image_id = image["image_id"]
-            delete_url = f"{base_url}/{image_id}"
-
-            delete_resp = requests.delete(
-                delete_url,
-                headers=headers,
-                timeout=30,
+        # Python 3.10 compatible equivalent of asyncio.TaskGroup
+        results = await asyncio.gather(
+            *(
+                delete_image(
+                    session,
+                    semaphore,
+                    base_url=base_url,
+                    image_id=image["image_id"],
+                )
+                for image in images
             )
+        )
 
-            if delete_resp.ok:
-                logger.info("Deleted image", extra={"image_id": image_id})
-            else:
-                logger.error(
-                    "Failed to delete image",
-                    extra={
-                        "image_id": image_id,
-                        "status": delete_resp.status_code,
-                        "response": delete_resp.text,
-                    },
-                )
+    failed_ids = [image["image_id"] for image, ok in zip(images, results, strict=True) if not ok]
+
+    logger.info(
+        "Cleanup summary",
+        extra={
+            "deleted": len(images) - len(failed_ids),
+            "failed_count": len(failed_ids),
+            "failed_ids": failed_ids[:MAX_LOGGED_FAILED_IDS],
+        },
+    )
 
-        logger.info("Cleanup completed successfully")
+
+def cleanup_images() -> None:
+    try:
+        args = parse_args()
+        asyncio.run(_cleanup(args))
 
     except Exception as exc:
         logger.exception("Cleanup failed", exc_info=exc)
@@ -9,20 +9,26 @@ Run:
 """
 
 import argparse
-import base64
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 import json
 from pathlib import Path
 import sys
 from typing import Any, cast
 
+import aiohttp
 from aws_lambda_powertools import Logger
-import requests
 
 logger = Logger(service="seed")
 
 
 UPLOAD_API_URL = "http://localhost:4566/restapis/{0}/snd/_user_request_/v1/images"
 
+# Upper bound on in-flight uploads so LocalStack is not overwhelmed
+MAX_CONCURRENT_UPLOADS = 16
+REQUEST_TIMEOUT_SECONDS = 30
+KEEPALIVE_TIMEOUT_SECONDS = 30
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Seed images via Image Storage API")
@@ -53,56 +59,39 @@ def load_sample_data() -> dict[str, Any]:
         return cast(dict[str, Any], json.load(f))
 
 
-def seed_images() -> None:
-    try:
-        args = parse_args()
-        data = load_sample_data()
-
-        images_dir = Path(__file__).parent / "images"
-
-        headers: dict[str, str] = {
-            "Content-Type": "application/json",
-        }
-        if args.api_key:
-            headers["x-api-key"] = args.api_key
-
-        upload_url = UPLOAD_API_URL.format(args.api_id)
-
-        logger.info(
-            "Starting seeding process",
-            extra={"api_base_url": upload_url},
+async def upload_image(
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    *,
+    upload_url: str,
+    image_path: Path,
+    item: dict[str, Any],
+) -> None:
+    """Upload a single sample image, logging the outcome."""
+    async with semaphore:
+        image_bytes = await asyncio.to_thread(image_path.read_bytes)
+
+        # multipart/form-data carries the raw bytes: no base64 pass and
+        # roughly 25% fewer bytes on the wire than a base64 JSON body
+        form = aiohttp.FormData()
+        form.add_field(
+            "file",
+            image_bytes,
+            filename=item["image_name"],
+            content_type="application/octet-stream",
         )
+        form.add_field("user_id", item["user_id"])
+        form.add_field("image_name", item["image_name"])
 
-        for item in cast(list[dict[str, Any]], data.get("images", []))[: args.limit]:
-            image_path = images_dir / item["image_name"]
+        if item.get("description"):
+            form.add_field("description", item["description"])
+        if item.get("tags"):
+            form.add_field("tags", ",".join(item["tags"]))
 
-            if not image_path.exists():
-                logger.warning("Image file not found", extra={"path": str(image_path)})
-                continue
+        async with session.post(upload_url, data=form) as response:
+            response_json = cast(dict[str, Any], await response.json(content_type=None))
 
-            with open(image_path, "rb") as f:
-                image_bytes = f.read()
-
-            encoded_file = base64.b64encode(image_bytes).decode("utf-8")
-
-            payload: dict[str, Any] = {
-                "file": encoded_file,
-                "user_id": item["user_id"],
-                "image_name": item["image_name"],
-                "description": item.get("description"),
-                "tags": item.get("tags"),
-            }
-
-            response = requests.post(
-                upload_url,
-                headers=headers,
-                json=payload,
-                timeout=30,
-            )
-
-            response_json = cast(dict[str, Any], response.json())
-
-            if response.status_code == 201:
+            if response.status == 201:
                 logger.info(
                     "Seeded image",
                     extra={
@@ -115,32 +104,89 @@ def seed_images() -> None:
                     "Failed to seed image",
                     extra={
                         "image": item["image_name"],
-                        "status": response.status_code,
+                        "status": response.status,
                         "response": response_json,
                     },
                 )
 
+
+async def _seed(args: argparse.Namespace) -> None:
+    data = load_sample_data()
+
+    images_dir = Path(__file__).parent / "images"
+
+    headers: dict[str, str] = {}
+    if args.api_key:
+        headers["x-api-key"] = args.api_key
+
+    upload_url = UPLOAD_API_URL.format(args.api_id)
+
+    logger.info(
+        "Starting seeding process",
+        extra={"api_base_url": upload_url},
+    )
+
+    # File reads run via asyncio.to_thread; size the pool to the upload cap so
+    # every in-flight upload can read concurrently (the default is cpu + 4)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=MAX_CONCURRENT_UPLOADS, thread_name_prefix="seed-io")
+    )
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+    timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+
+    # One keep-alive pool sized to the concurrency cap: every request reuses
+    # an already-open connection instead of paying a fresh TCP handshake.
+    connector = aiohttp.TCPConnector(
+        limit=MAX_CONCURRENT_UPLOADS,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+    )
+
+    async with aiohttp.ClientSession(headers=headers, timeout=timeout, connector=connector) as session:
+        uploads = []
+
+        for item in cast(list[dict[str, Any]], data.get("images", []))[: args.limit]:
+            image_path = images_dir / item["image_name"]
+
+            if not image_path.exists():
+                logger.warning("Image file not found", extra={"path": str(image_path)})
+                continue
+
+            uploads.append(
+                upload_image(
+                    session,
+                    semaphore,
+                    upload_url=upload_url,
+                    image_path=image_path,
+                    item=item,
+                )
+            )
+
+        # Python 3.10 compatible equivalent of asyncio.TaskGroup:
+        # the first failing upload propagates and aborts the run.
+        await asyncio.gather(*uploads)
+
         logger.info("Seeding completed")
 
         first_user = cast(dict[str, Any], data["images"][0])["user_id"]
         list_url = UPLOAD_API_URL.format(args.api_id)
 
-        list_response = requests.get(
-            list_url,
-            headers=headers,
-            params={"user_id": first_user},
-            timeout=30,
-        )
+        async with session.get(list_url, params={"user_id": first_user}) as list_response:
+            list_response_text = await list_response.text()
 
-        list_response_json = cast(dict[str, Any], list_response.json())
+            logger.info(
+                "List images response",
+                extra={
+                    "status": list_response.status,
+                    "response": json.loads(list_response_text) if list_response.ok else list_response_text,
+                },
+            )
 
-        logger.info(
-            "List images response",
-            extra={
-                "status": list_response.status_code,
-                "response": list_response_json if list_response.ok else list_response.text,
-            },
-        )
+
+def seed_images() -> None:
+    try:
+        args = parse_args()
+        asyncio.run(_seed(args))
 
     except Exception as exc:
         logger.exception("Seeding failed", exc_info=exc)
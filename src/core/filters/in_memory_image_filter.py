@@ -14,7 +14,7 @@ from core.filters.name_contains_filter import NameContainsFilter
 from core.filters.offset_pagination import OffsetPagination
 
 ImageItem = dict[str, Any]
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 
 class InMemoryImageFilter:
@@ -44,6 +44,10 @@ class InMemoryImageFilter:
         """
         Apply substring-based name filtering to image metadata.
 
+        Stays in pure Python: inputs are bounded by MAX_LIMIT items per
+        request, well below the size where a vectorized kernel (e.g.
+        pyarrow.compute) would repay its conversion cost.
+
         Args:
             items: List of image metadata dictionaries
             name_contains: Substring to match in image names
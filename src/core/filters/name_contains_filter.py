@@ -2,6 +2,11 @@
 
 from typing import Any
 
+from core.utils.constants import IMAGE_NAME_LOWER_ATTRIBUTE
+
+# Fields whose lowercased copy is stored alongside the item at ingest
+_LOWERCASED_FIELDS: dict[str, str] = {"image_name": IMAGE_NAME_LOWER_ATTRIBUTE}
+
 
 class NameContainsFilter:
     """Filter images by name using case-insensitive substring search.
@@ -29,9 +34,23 @@ class NameContainsFilter:
             return items
 
         search_lower = search_term.lower()
-        return [item for item in items if search_lower in item.get(field_name, "").lower()]
+        lower_field = _LOWERCASED_FIELDS.get(field_name)
+        return [item for item in items if search_lower in _lowered(item, field_name, lower_field)]
 
     @staticmethod
     def validate(search_term: str) -> bool:
         """Validate name filter search term."""
         return bool(search_term and search_term.strip())
+
+
+def _lowered(item: dict[str, Any], field_name: str, lower_field: str | None) -> str:
+    """Return the lowercased field value, preferring the copy stored at ingest.
+
+    Legacy items written before the copy existed are lowercased locally.
+    """
+    if lower_field is not None:
+        stored = item.get(lower_field)
+        if isinstance(stored, str):
+            return stored
+    value: str = item.get(field_name, "")
+    return value.lower()
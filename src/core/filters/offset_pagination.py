@@ -11,6 +11,12 @@ from core.utils.constants import (
     MIN_LIMIT,
 )
 
+# Prebuilt validation results so the common valid path allocates nothing
+_VALID: tuple[bool, str] = (True, "")
+_LIMIT_TOO_SMALL: tuple[bool, str] = (False, f"Limit must be at least {MIN_LIMIT}")
+_LIMIT_TOO_LARGE: tuple[bool, str] = (False, f"Limit must not exceed {MAX_LIMIT}")
+_NEGATIVE_OFFSET: tuple[bool, str] = (False, "Offset must be zero or a positive integer")
+
 
 class OffsetPagination:
     """
@@ -23,6 +29,10 @@ class OffsetPagination:
     1. Validate offset and limit parameters
     2. Apply pagination to a list of items
     3. Return paginated items along with metadata
+
+    The list API pages with DynamoDB keys by default; this helper is
+    only used for in-memory refinement, where the full item set has
+    already been fetched.
     """
 
     @staticmethod
@@ -88,16 +98,17 @@ class OffsetPagination:
             validate(limit=20, offset=0)
             → (True, "")
         """
+        # Single combined check for the common case
+        if MIN_LIMIT <= limit <= MAX_LIMIT and offset >= 0:
+            return _VALID
+
         if limit < MIN_LIMIT:
-            return False, f"Limit must be at least {MIN_LIMIT}"
+            return _LIMIT_TOO_SMALL
 
         if limit > MAX_LIMIT:
-            return False, f"Limit must not exceed {MAX_LIMIT}"
-
-        if offset < 0:
-            return False, "Offset must be zero or a positive integer"
+            return _LIMIT_TOO_LARGE
 
-        return True, ""
+        return _NEGATIVE_OFFSET
 
     @staticmethod
     def get_page_info(
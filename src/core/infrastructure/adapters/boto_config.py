@@ -0,0 +1,20 @@
+"""Shared botocore configuration for AWS adapters."""
+
+from botocore.config import Config
+
+# Connections kept open per client; sized above typical in-flight calls
+MAX_POOL_CONNECTIONS = 32
+MAX_ATTEMPTS = 3
+
+# Fail fast on a stalled connection so a retry fits in the Lambda timeout;
+# botocore's 60s defaults would outlive the function itself
+CONNECT_TIMEOUT_SECONDS = 1
+READ_TIMEOUT_SECONDS = 3
+
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    connect_timeout=CONNECT_TIMEOUT_SECONDS,
+    read_timeout=READ_TIMEOUT_SECONDS,
+    retries={"mode": "adaptive", "max_attempts": MAX_ATTEMPTS},
+)
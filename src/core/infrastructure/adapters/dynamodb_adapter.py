@@ -1,16 +1,66 @@
 """Thin DynamoDB adapter wrapping boto3 table operations."""
 
+from dataclasses import dataclass, field
+from functools import lru_cache
 import os
+import random
+import time
 from typing import Any, Protocol, cast
 
 import boto3
+from boto3.dynamodb.conditions import ConditionBase
 
+from core.infrastructure.adapters.boto_config import BOTO_CLIENT_CONFIG
 from core.utils.constants import (
     ENV_AWS_ENDPOINT_URL,
+    ENV_AWS_ENDPOINT_URL_DYNAMODB,
     ENV_AWS_REGION,
     ENV_IMAGE_METADATA_TABLE_NAME,
 )
 
+# Partition key of the image metadata table
+TABLE_PARTITION_KEYS = ["image_id"]
+
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+BATCH_GET_MAX_RETRIES = 5
+BATCH_GET_BACKOFF_BASE_SECONDS = 0.05
+
+# Single-item writes never use the old item or capacity figures, so
+# ask for the smallest response DynamoDB can send
+MINIMAL_WRITE_RESPONSE: dict[str, str] = {
+    "ReturnValues": "NONE",
+    "ReturnConsumedCapacity": "NONE",
+}
+
+
+@dataclass(frozen=True)
+class TransactDelete:
+    """One delete within a TransactWriteItems request.
+
+    Transactions go through the low-level client, so conditions are
+    plain expression strings with their values, not condition objects.
+    """
+
+    key: dict[str, Any]
+    condition_expression: str | None = None
+    expression_values: dict[str, Any] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=4)
+def _dynamodb_resource(endpoint_url: str | None, region_name: str | None) -> Any:
+    """Return a DynamoDB resource shared across adapter instances.
+
+    Warm Lambda invocations reuse the same resource, and with it the
+    resolved credentials and pooled keep-alive connections.
+    """
+    return boto3.resource(
+        "dynamodb",
+        endpoint_url=endpoint_url,
+        region_name=region_name,
+        config=BOTO_CLIENT_CONFIG,
+    )
+
 
 class DynamoDBAdapterProtocol(Protocol):
     """Repository-facing DynamoDB adapter protocol."""
@@ -24,10 +74,36 @@ class DynamoDBAdapterProtocol(Protocol):
 
     def get_item(self, *, key: dict[str, Any]) -> dict[str, Any]: ...
 
-    def delete_item(self, *, key: dict[str, Any]) -> dict[str, Any]: ...
+    def delete_item(
+        self,
+        *,
+        key: dict[str, Any],
+        condition_expression: ConditionBase | None = None,
+    ) -> dict[str, Any]: ...
 
     def query(self, **kwargs: Any) -> dict[str, Any]: ...
 
+    def scan(self, **kwargs: Any) -> dict[str, Any]: ...
+
+    def paginate_query(
+        self,
+        *,
+        key_condition: Any,
+        limit: int,
+        exclusive_start_key: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]: ...
+
+    def batch_get(self, *, keys: list[dict[str, Any]]) -> list[dict[str, Any]]: ...
+
+    def transact_put(self, *, items: list[dict[str, Any]], condition_expression: str) -> None: ...
+
+    def transact_delete(self, *, deletes: list[TransactDelete]) -> None: ...
+
+    def batch_put(self, *, items: list[dict[str, Any]]) -> None: ...
+
+    def batch_delete(self, *, keys: list[dict[str, Any]]) -> None: ...
+
 
 class DynamoDBAdapter:
     """Low-level DynamoDB operations (mechanical, no error handling).
@@ -44,10 +120,9 @@ class DynamoDBAdapter:
         if not table_name:
             raise RuntimeError(f"{ENV_IMAGE_METADATA_TABLE_NAME} environment variable is not set")
 
-        dynamodb = boto3.resource(
-            "dynamodb",
-            endpoint_url=os.getenv(ENV_AWS_ENDPOINT_URL),
-            region_name=os.getenv(ENV_AWS_REGION),
+        dynamodb = _dynamodb_resource(
+            os.getenv(ENV_AWS_ENDPOINT_URL_DYNAMODB) or os.getenv(ENV_AWS_ENDPOINT_URL),
+            os.getenv(ENV_AWS_REGION),
         )
 
         # IMPORTANT:
@@ -61,7 +136,7 @@ class DynamoDBAdapter:
         condition_expression: str | None = None,
     ) -> dict[str, Any]:
         """Insert item into DynamoDB."""
-        kwargs: dict[str, Any] = {"Item": item}
+        kwargs: dict[str, Any] = {"Item": item, **MINIMAL_WRITE_RESPONSE}
 
         if condition_expression:
             kwargs["ConditionExpression"] = condition_expression
@@ -71,8 +146,124 @@ class DynamoDBAdapter:
     def get_item(self, *, key: dict[str, Any]) -> dict[str, Any]:
         return cast(dict[str, Any], self._table.get_item(Key=key))
 
-    def delete_item(self, *, key: dict[str, Any]) -> dict[str, Any]:
-        return cast(dict[str, Any], self._table.delete_item(Key=key))
+    def delete_item(
+        self,
+        *,
+        key: dict[str, Any],
+        condition_expression: ConditionBase | None = None,
+    ) -> dict[str, Any]:
+        """Delete an item, optionally only if the condition holds."""
+        kwargs: dict[str, Any] = {"Key": key, **MINIMAL_WRITE_RESPONSE}
+
+        if condition_expression is not None:
+            kwargs["ConditionExpression"] = condition_expression
+
+        return cast(dict[str, Any], self._table.delete_item(**kwargs))
 
     def query(self, **kwargs: Any) -> dict[str, Any]:
         return cast(dict[str, Any], self._table.query(**kwargs))
+
+    def scan(self, **kwargs: Any) -> dict[str, Any]:
+        return cast(dict[str, Any], self._table.scan(**kwargs))
+
+    def paginate_query(
+        self,
+        *,
+        key_condition: Any,
+        limit: int,
+        exclusive_start_key: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+        """Run a single query page.
+
+        Returns:
+            A tuple of (items, last_evaluated_key). last_evaluated_key is
+            None when DynamoDB has no further pages.
+        """
+        query_kwargs: dict[str, Any] = {
+            "KeyConditionExpression": key_condition,
+            "Limit": limit,
+            **kwargs,
+        }
+
+        if exclusive_start_key:
+            query_kwargs["ExclusiveStartKey"] = exclusive_start_key
+
+        response = self._table.query(**query_kwargs)
+        return response.get("Items", []), response.get("LastEvaluatedKey")
+
+    def batch_get(self, *, keys: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fetch up to BATCH_GET_MAX_KEYS items with BatchGetItem.
+
+        UnprocessedKeys are retried with jittered exponential backoff.
+        Uses the table's underlying client, which is safe to call from
+        worker threads.
+
+        Raises:
+            RuntimeError: If keys remain unprocessed after all retries
+        """
+        client = self._table.meta.client
+        request: dict[str, Any] = {self._table.name: {"Keys": keys}}
+        items: list[dict[str, Any]] = []
+
+        for attempt in range(BATCH_GET_MAX_RETRIES + 1):
+            if attempt:
+                time.sleep(random.uniform(0, BATCH_GET_BACKOFF_BASE_SECONDS * 2**attempt))
+
+            response = client.batch_get_item(RequestItems=request)
+            items.extend(response.get("Responses", {}).get(self._table.name, []))
+
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                return items
+
+        raise RuntimeError("BatchGetItem left unprocessed keys after retries")
+
+    def transact_put(self, *, items: list[dict[str, Any]], condition_expression: str) -> None:
+        """Insert items atomically with TransactWriteItems.
+
+        Every put carries the same condition; if any fails, none are written.
+        """
+        self._table.meta.client.transact_write_items(
+            TransactItems=[
+                {
+                    "Put": {
+                        "TableName": self._table.name,
+                        "Item": item,
+                        "ConditionExpression": condition_expression,
+                    }
+                }
+                for item in items
+            ]
+        )
+
+    def transact_delete(self, *, deletes: list[TransactDelete]) -> None:
+        """Delete items atomically with TransactWriteItems.
+
+        If any delete's condition fails, nothing is deleted.
+        """
+        transact_items: list[dict[str, Any]] = []
+        for delete in deletes:
+            request: dict[str, Any] = {"TableName": self._table.name, "Key": delete.key}
+            if delete.condition_expression:
+                request["ConditionExpression"] = delete.condition_expression
+                request["ExpressionAttributeValues"] = delete.expression_values
+            transact_items.append({"Delete": request})
+
+        self._table.meta.client.transact_write_items(TransactItems=transact_items)
+
+    def batch_put(self, *, items: list[dict[str, Any]]) -> None:
+        """Insert many items using BatchWriteItem (up to 25 per request).
+
+        Items sharing the same key within a batch are de-duplicated,
+        keeping the last one.
+        """
+        with self._table.batch_writer(overwrite_by_pkeys=TABLE_PARTITION_KEYS) as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+    def batch_delete(self, *, keys: list[dict[str, Any]]) -> None:
+        """Delete many items using BatchWriteItem (up to 25 per request)."""
+        with self._table.batch_writer(overwrite_by_pkeys=TABLE_PARTITION_KEYS) as batch:
+            for key in keys:
+                batch.delete_item(Key=key)
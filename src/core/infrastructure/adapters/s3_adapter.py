@@ -1,17 +1,24 @@
 """Thin adapter for interacting with Amazon S3."""
 
 from collections.abc import Mapping
+from functools import lru_cache
 import os
+from types import MappingProxyType
 from typing import Any, Protocol
 
 import boto3
 
+from core.infrastructure.adapters.boto_config import BOTO_CLIENT_CONFIG
 from core.utils.constants import (
     ENV_AWS_ENDPOINT_URL,
+    ENV_AWS_ENDPOINT_URL_S3,
     ENV_AWS_REGION,
     ENV_IMAGE_S3_BUCKET_NAME,
 )
 
+# Maximum number of keys accepted by a single DeleteObjects request
+DELETE_OBJECTS_BATCH_SIZE = 1000
+
 
 class _Boto3S3Client(Protocol):
     """Internal typing for boto3 S3 client (AWS-facing only)."""
@@ -31,6 +38,7 @@ class _Boto3S3Client(Protocol):
         *,
         Bucket: str,
         Key: str,
+        Range: str = ...,
     ) -> Mapping[str, Any]: ...
 
     def delete_object(
@@ -40,6 +48,13 @@ class _Boto3S3Client(Protocol):
         Key: str,
     ) -> Any: ...
 
+    def delete_objects(
+        self,
+        *,
+        Bucket: str,
+        Delete: Mapping[str, Any],
+    ) -> dict[str, Any]: ...
+
     def generate_presigned_url(
         self,
         ClientMethod: str,
@@ -48,6 +63,22 @@ class _Boto3S3Client(Protocol):
     ) -> str: ...
 
 
+@lru_cache(maxsize=4)
+def _s3_client(endpoint_url: str | None, region_name: str | None) -> _Boto3S3Client:
+    """Return an S3 client shared across adapter instances.
+
+    Warm Lambda invocations reuse the same client, and with it the
+    resolved credentials and pooled keep-alive connections.
+    """
+    client: _Boto3S3Client = boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        region_name=region_name,
+        config=BOTO_CLIENT_CONFIG,
+    )
+    return client
+
+
 class S3AdapterProtocol(Protocol):
     """Minimal S3 adapter protocol (repository-facing)."""
 
@@ -60,10 +91,12 @@ class S3AdapterProtocol(Protocol):
         metadata: dict[str, str],
     ) -> None: ...
 
-    def get_object(self, *, key: str) -> Mapping[str, Any]: ...
+    def get_object(self, *, key: str, byte_range: str | None = None) -> Mapping[str, Any]: ...
 
     def delete_object(self, *, key: str) -> None: ...
 
+    def delete_objects(self, *, keys: list[str]) -> list[dict[str, Any]]: ...
+
     def generate_presigned_url(
         self,
         *,
@@ -89,10 +122,11 @@ class S3Adapter:
             raise RuntimeError(f"{ENV_IMAGE_S3_BUCKET_NAME} environment variable is not set")
 
         self._bucket = bucket_name
-        self._client: _Boto3S3Client = boto3.client(
-            "s3",
-            endpoint_url=os.getenv(ENV_AWS_ENDPOINT_URL),
-            region_name=os.getenv(ENV_AWS_REGION),
+        # Fixed per adapter; merged into every pre-signed URL request
+        self._presign_base: MappingProxyType[str, str] = MappingProxyType({"Bucket": bucket_name})
+        self._client: _Boto3S3Client = _s3_client(
+            os.getenv(ENV_AWS_ENDPOINT_URL_S3) or os.getenv(ENV_AWS_ENDPOINT_URL),
+            os.getenv(ENV_AWS_REGION),
         )
 
     def put_object(
@@ -114,15 +148,17 @@ class S3Adapter:
             Metadata=metadata,
         )
 
-    def get_object(self, *, key: str) -> Mapping[str, Any]:
-        """Fetch object from S3.
+    def get_object(self, *, key: str, byte_range: str | None = None) -> Mapping[str, Any]:
+        """Fetch object from S3, optionally only an HTTP byte range.
         Raises boto3 exceptions - caught by domain implementation.
         """
-        response = self._client.get_object(
+        if byte_range:
+            return self._client.get_object(Bucket=self._bucket, Key=key, Range=byte_range)
+
+        return self._client.get_object(
             Bucket=self._bucket,
             Key=key,
         )
-        return response
 
     def delete_object(self, *, key: str) -> None:
         """Delete object from S3.
@@ -133,6 +169,26 @@ class S3Adapter:
             Key=key,
         )
 
+    def delete_objects(self, *, keys: list[str]) -> list[dict[str, Any]]:
+        """Delete many objects, up to 1000 keys per DeleteObjects request.
+
+        Quiet mode is used, so each response only lists keys that failed
+        under "Errors".
+        Raises boto3 exceptions - caught by domain implementation.
+        """
+        responses: list[dict[str, Any]] = []
+
+        for start in range(0, len(keys), DELETE_OBJECTS_BATCH_SIZE):
+            batch = keys[start : start + DELETE_OBJECTS_BATCH_SIZE]
+            responses.append(
+                self._client.delete_objects(
+                    Bucket=self._bucket,
+                    Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                )
+            )
+
+        return responses
+
     def generate_presigned_url(
         self,
         *,
@@ -143,6 +199,6 @@ class S3Adapter:
         """Generate a pre-signed S3 URL."""
         return self._client.generate_presigned_url(
             ClientMethod=method,
-            Params={**params, "Bucket": self._bucket},
+            Params=params | self._presign_base,
             ExpiresIn=expires_in,
         )
@@ -0,0 +1,8 @@
+"""Helpers for inspecting botocore ClientError responses."""
+
+from botocore.exceptions import ClientError
+
+
+def client_error_code(exc: ClientError) -> str:
+    """Return the AWS error code of a ClientError, or "" if absent."""
+    return exc.response.get("Error", {}).get("Code") or ""
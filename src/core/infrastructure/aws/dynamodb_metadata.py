@@ -1,30 +1,92 @@
 """DynamoDB-backed implementation of ImageMetadataRepository."""
 
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from functools import lru_cache
+import logging
+import os
 from typing import Any
 
 from aws_lambda_powertools import Logger
-from boto3.dynamodb.conditions import ConditionBase, Key
+from boto3.dynamodb.conditions import Attr, ConditionBase, Key
 from botocore.exceptions import ClientError
 
-from core.infrastructure.adapters.dynamodb_adapter import DynamoDBAdapter, DynamoDBAdapterProtocol
+from core.infrastructure.adapters.dynamodb_adapter import (
+    BATCH_GET_MAX_KEYS,
+    DynamoDBAdapter,
+    DynamoDBAdapterProtocol,
+    TransactDelete,
+)
+from core.infrastructure.aws.client_errors import client_error_code
 from core.models.errors import (
     DuplicateImageError,
     DynamoDBError,
     FilterError,
 )
 from core.repositories.metadata_repository import ImageMetadataRepository
+from core.utils.concurrency import IO_EXECUTOR
 from core.utils.constants import (
+    ENV_DEDUP_LEGACY_CHECK,
     ERROR_CODE_METADATA_CREATE_FAILED,
     ERROR_CODE_METADATA_DELETE_FAILED,
     ERROR_CODE_METADATA_DUPLICATE_CHECK_FAILED,
     ERROR_CODE_METADATA_FETCH_FAILED,
     ERROR_CODE_METADATA_LIST_FAILED,
+    IMAGE_NAME_LOWER_ATTRIBUTE,
+    LIST_IMAGE_ATTRIBUTES,
     MAX_LIMIT,
 )
+from core.utils.ttl_cache import TTLCache
 
 Metadata = dict[str, Any]
 
-logger = Logger(UTC=True)
+USER_CREATED_INDEX = "user-created-index"
+
+# Condition builders are immutable, so they are built once and reused
+_USER_ID_KEY = Key("user_id")
+_CREATED_AT_KEY = Key("created_at")
+_FILE_HASH_KEY = Key("file_hash")
+_NAME_LOWER_ATTR = Attr(IMAGE_NAME_LOWER_ATTRIBUTE)
+_DEDUP_IMAGE_ID_ATTR = Attr("dedup_image_id")
+
+# Known (user_id, file_hash) duplicates are remembered briefly so
+# retried uploads of the same file skip the duplicate-check query
+KNOWN_DUPLICATE_TTL_SECONDS = 60
+KNOWN_DUPLICATE_MAX_ENTRIES = 4096
+
+KnownDuplicates = TTLCache[tuple[str, str], str]
+
+# Marker items claim a (user_id, file_hash) pair in the main table. They
+# carry no index attributes, so none of the GSIs ever see them.
+DEDUP_MARKER_PREFIX = "dedup#"
+
+# Images stored before dedup markers existed have none. Until
+# backfill_dedup_markers has run, set DEDUP_LEGACY_CHECK=true so every
+# marked write is also checked against the file-hash index and rolled
+# back if older content matches.
+LEGACY_DUPLICATE_CHECK = os.getenv(ENV_DEDUP_LEGACY_CHECK, "").lower() == "true"
+
+logger = Logger(utc=True)
+
+
+@lru_cache(maxsize=1)
+def _default_adapter() -> DynamoDBAdapterProtocol:
+    """Return the adapter shared by default-constructed repositories.
+
+    Services build a repository per invocation; sharing the adapter
+    keeps the table handle and its connection pool warm across them.
+    """
+    return DynamoDBAdapter()
+
+
+def _new_known_duplicates() -> KnownDuplicates:
+    return TTLCache(maxsize=KNOWN_DUPLICATE_MAX_ENTRIES, ttl=KNOWN_DUPLICATE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _default_known_duplicates() -> KnownDuplicates:
+    """Return the duplicate cache shared alongside the default adapter."""
+    return _new_known_duplicates()
 
 
 class DynamoDBMetadata(ImageMetadataRepository):
@@ -35,8 +97,13 @@ class DynamoDBMetadata(ImageMetadataRepository):
     """
 
     def __init__(self, adapter: DynamoDBAdapterProtocol | None = None) -> None:
-        """Initialize with DynamoDB adapter."""
-        self._db: DynamoDBAdapterProtocol = adapter or DynamoDBAdapter()
+        """Initialize with DynamoDB adapter.
+
+        Repositories on the default adapter share one known-duplicate
+        cache; an injected adapter gets a private one.
+        """
+        self._db: DynamoDBAdapterProtocol = adapter or _default_adapter()
+        self._known_duplicates = _default_known_duplicates() if adapter is None else _new_known_duplicates()
 
     def create_metadata(self, *, metadata: Metadata) -> None:
         """Create metadata for an image.
@@ -46,31 +113,22 @@ class DynamoDBMetadata(ImageMetadataRepository):
             DuplicateImageError: If image already exists for this user
             DynamoDBError: If creation fails
         """
-        # Extract and validate required fields
-        image_id = metadata.get("image_id")
-        user_id = metadata.get("user_id")
-        file_hash = metadata.get("file_hash")
-
-        # Validate required fields
-        if not image_id or not isinstance(image_id, str) or not image_id.strip():
-            raise ValueError("metadata must contain non-empty 'image_id' (string)")
-
-        if not user_id or not isinstance(user_id, str) or not user_id.strip():
-            raise ValueError("metadata must contain non-empty 'user_id' (string)")
+        image_id, user_id, file_hash = self._required_fields(metadata)
 
-        if not file_hash or not isinstance(file_hash, str) or not file_hash.strip():
-            raise ValueError("metadata must contain non-empty 'file_hash' (string)")
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Creating metadata",
+                extra={"image_id": image_id, "user_id": user_id},
+            )
 
-        logger.debug(
-            "Creating metadata",
-            extra={"image_id": image_id, "user_id": user_id},
-        )
+        item = self._build_item(metadata)
 
         try:
             self._db.put_item(
-                item=metadata,
+                item=item,
                 condition_expression="attribute_not_exists(image_id)",  # Partition key
             )
+            self._known_duplicates.set((user_id, file_hash), image_id)
             logger.info(
                 "Metadata created",
                 extra={"image_id": image_id, "user_id": user_id},
@@ -82,7 +140,7 @@ class DynamoDBMetadata(ImageMetadataRepository):
                 extra={"image_id": image_id, "user_id": user_id},
             )
 
-            if exc.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+            if client_error_code(exc) == "ConditionalCheckFailedException":
                 raise DuplicateImageError(
                     message="This image already exists",
                     details={"image_id": image_id},
@@ -102,13 +160,134 @@ class DynamoDBMetadata(ImageMetadataRepository):
                 details={"image_id": image_id},
             ) from exc
 
+    def create_metadata_atomic_dedup(self, *, metadata: Metadata) -> None:
+        """Create metadata and claim its content hash in one transaction.
+
+        A dedup marker keyed on (user_id, file_hash) is written together
+        with the metadata item, so the write itself rejects duplicates.
+        While DEDUP_LEGACY_CHECK is enabled, a successful write is then
+        checked against images stored without a marker and rolled back
+        if one holds the same content.
+
+        Raises:
+            ValueError: If metadata is missing required fields
+            DuplicateImageError: If the image or its content already exists
+            DynamoDBError: If creation fails
+        """
+        image_id, user_id, file_hash = self._required_fields(metadata)
+
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Creating metadata with dedup marker",
+                extra={"image_id": image_id, "user_id": user_id},
+            )
+
+        marker = {
+            "image_id": self._dedup_marker_key(user_id=user_id, file_hash=file_hash),
+            "dedup_image_id": image_id,
+        }
+
+        try:
+            self._db.transact_put(
+                items=[self._build_item(metadata), marker],
+                condition_expression="attribute_not_exists(image_id)",  # Partition key
+            )
+
+        except ClientError as exc:
+            logger.error(
+                "DynamoDB transact_write_items failed",
+                extra={"image_id": image_id, "user_id": user_id},
+            )
+
+            reasons = exc.response.get("CancellationReasons", [])
+            if any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                raise DuplicateImageError(
+                    message="This image already exists",
+                    details={"user_id": user_id},
+                ) from exc
+
+            raise DynamoDBError(
+                message="Unable to save image metadata at this time",
+                error_code=ERROR_CODE_METADATA_CREATE_FAILED,
+                details={"image_id": image_id},
+            ) from exc
+
+        except Exception as exc:
+            logger.exception("Unexpected error creating metadata")
+            raise DynamoDBError(
+                message="Unable to save image metadata at this time",
+                error_code=ERROR_CODE_METADATA_CREATE_FAILED,
+                details={"image_id": image_id},
+            ) from exc
+
+        if LEGACY_DUPLICATE_CHECK:
+            self._reject_unmarked_duplicate(image_id=image_id, user_id=user_id, file_hash=file_hash)
+
+        self._known_duplicates.set((user_id, file_hash), image_id)
+        logger.info(
+            "Metadata created",
+            extra={"image_id": image_id, "user_id": user_id},
+        )
+
+    def _reject_unmarked_duplicate(self, *, image_id: str, user_id: str, file_hash: str) -> None:
+        """Roll back a marked write that duplicates an image without a marker.
+
+        Fails closed: if the check itself fails, the write is rolled
+        back too.
+
+        Raises:
+            DuplicateImageError: If another image holds the same content
+            DynamoDBError: If the check fails
+        """
+        try:
+            is_duplicate = self.check_duplicate_image(
+                user_id=user_id,
+                file_hash=file_hash,
+                exclude_image_id=image_id,
+            )
+        except DynamoDBError:
+            self._roll_back_create(image_id=image_id, user_id=user_id, file_hash=file_hash)
+            raise
+
+        if is_duplicate:
+            self._roll_back_create(image_id=image_id, user_id=user_id, file_hash=file_hash)
+            raise DuplicateImageError(
+                message="This image already exists",
+                details={"user_id": user_id},
+            )
+
+    def _roll_back_create(self, *, image_id: str, user_id: str, file_hash: str) -> None:
+        """Best-effort removal of a just-created item and its dedup marker."""
+        try:
+            self.remove_metadata(image_id=image_id, user_id=user_id, file_hash=file_hash)
+        except DynamoDBError:
+            logger.warning(
+                "Failed to roll back metadata after duplicate check",
+                extra={"image_id": image_id},
+            )
+
+    def create_metadata_atomic_dedup_async(self, *, metadata: Metadata) -> Future[None]:
+        """Run create_metadata_atomic_dedup on the shared I/O pool."""
+        return IO_EXECUTOR.submit(self.create_metadata_atomic_dedup, metadata=metadata)
+
+    def create_metadata_async(self, *, metadata: Metadata) -> Future[None]:
+        """Run create_metadata on the shared I/O pool and return its future."""
+        return IO_EXECUTOR.submit(self.create_metadata, metadata=metadata)
+
     def fetch_metadata(self, *, image_id: str) -> Metadata | None:
         """Fetch metadata for a single image.
 
+        Dedup markers share the image_id key space but are not images,
+        so their ids are reported as not found.
+
         Raises:
             DynamoDBError: If fetch fails
         """
-        logger.debug("Fetching metadata", extra={"image_id": image_id})
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Fetching metadata", extra={"image_id": image_id})
+
+        if image_id.startswith(DEDUP_MARKER_PREFIX):
+            return None
 
         try:
             response = self._db.get_item(key={"image_id": image_id})
@@ -142,16 +321,73 @@ class DynamoDBMetadata(ImageMetadataRepository):
                 details={"image_id": image_id},
             ) from exc
 
-    def remove_metadata(self, *, image_id: str) -> None:
+    def fetch_metadata_bulk(self, *, image_ids: list[str]) -> dict[str, Metadata]:
+        """Fetch metadata for many images using BatchGetItem.
+
+        Ids are de-duplicated and sent 100 per request, with requests
+        dispatched concurrently on the shared I/O pool. Ids with no
+        stored metadata, and dedup marker ids, are absent from the result.
+
+        Raises:
+            DynamoDBError: If fetch fails
+        """
+        unique_ids = [image_id for image_id in dict.fromkeys(image_ids) if not image_id.startswith(DEDUP_MARKER_PREFIX)]
+        chunks = [unique_ids[i : i + BATCH_GET_MAX_KEYS] for i in range(0, len(unique_ids), BATCH_GET_MAX_KEYS)]
+
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Fetching metadata in bulk",
+                extra={"count": len(unique_ids), "requests": len(chunks)},
+            )
+
+        try:
+            pages = IO_EXECUTOR.map(
+                lambda chunk: self._db.batch_get(keys=[{"image_id": image_id} for image_id in chunk]),
+                chunks,
+            )
+            return {item["image_id"]: item for page in pages for item in page}
+
+        except ClientError as exc:
+            logger.error("DynamoDB batch_get_item failed", extra={"count": len(unique_ids)})
+            raise DynamoDBError(
+                message="Unable to retrieve image metadata",
+                error_code=ERROR_CODE_METADATA_FETCH_FAILED,
+                details={"count": len(unique_ids)},
+            ) from exc
+
+        except Exception as exc:
+            logger.exception("Unexpected error fetching metadata in bulk")
+            raise DynamoDBError(
+                message="Unable to retrieve image metadata",
+                error_code=ERROR_CODE_METADATA_FETCH_FAILED,
+                details={"count": len(unique_ids)},
+            ) from exc
+
+    def remove_metadata(
+        self,
+        *,
+        image_id: str,
+        user_id: str | None = None,
+        file_hash: str | None = None,
+    ) -> None:
         """Remove metadata for an image.
 
+        When user_id and file_hash are given, the image's dedup marker
+        is removed in the same transaction, but only if it was claimed
+        by this image.
+
         Raises:
             DynamoDBError: If deletion fails
         """
-        logger.debug("Removing metadata", extra={"image_id": image_id})
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Removing metadata", extra={"image_id": image_id})
 
         try:
-            self._db.delete_item(key={"image_id": image_id})
+            if user_id and file_hash:
+                self._remove_with_marker(image_id=image_id, user_id=user_id, file_hash=file_hash)
+            else:
+                self._db.delete_item(key={"image_id": image_id})
+            self._known_duplicates.discard_values({image_id})
             logger.info("Metadata removed", extra={"image_id": image_id})
 
         except ClientError as exc:
@@ -170,6 +406,85 @@ class DynamoDBMetadata(ImageMetadataRepository):
                 details={"image_id": image_id},
             ) from exc
 
+    def remove_metadata_bulk(self, *, entries: list[tuple[str, str, str]]) -> None:
+        """Remove metadata for many images using BatchWriteItem.
+
+        Each entry is (image_id, user_id, file_hash). Items are deleted
+        25 per request; unprocessed items are resent by the batch
+        writer. Each image's dedup marker is then released concurrently,
+        only if it was claimed by that image.
+
+        Raises:
+            DynamoDBError: If deletion fails
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Removing metadata in bulk", extra={"count": len(entries)})
+
+        try:
+            self._db.batch_delete(keys=[{"image_id": image_id} for image_id, _, _ in entries])
+            list(IO_EXECUTOR.map(lambda entry: self._release_dedup_marker(*entry), entries))
+            self._known_duplicates.discard_values({image_id for image_id, _, _ in entries})
+            logger.info("Metadata removed in bulk", extra={"count": len(entries)})
+
+        except ClientError as exc:
+            logger.error("DynamoDB batch delete failed", extra={"count": len(entries)})
+            raise DynamoDBError(
+                message="Unable to delete image metadata",
+                error_code=ERROR_CODE_METADATA_DELETE_FAILED,
+                details={"count": len(entries)},
+            ) from exc
+
+        except Exception as exc:
+            logger.exception("Unexpected error removing metadata in bulk")
+            raise DynamoDBError(
+                message="Unable to delete image metadata",
+                error_code=ERROR_CODE_METADATA_DELETE_FAILED,
+                details={"count": len(entries)},
+            ) from exc
+
+    def _remove_with_marker(self, *, image_id: str, user_id: str, file_hash: str) -> None:
+        """Delete an item and the dedup marker it claimed, in one transaction.
+
+        If the marker is missing or claimed by another image, only the
+        item is deleted.
+
+        Raises:
+            ClientError: If deletion fails
+        """
+        marker_key = {"image_id": self._dedup_marker_key(user_id=user_id, file_hash=file_hash)}
+
+        try:
+            self._db.transact_delete(
+                deletes=[
+                    TransactDelete(key={"image_id": image_id}),
+                    TransactDelete(
+                        key=marker_key,
+                        condition_expression="dedup_image_id = :image_id",
+                        expression_values={":image_id": image_id},
+                    ),
+                ]
+            )
+        except ClientError as exc:
+            reasons = exc.response.get("CancellationReasons", [])
+            if not any(reason.get("Code") == "ConditionalCheckFailed" for reason in reasons):
+                raise
+            self._db.delete_item(key={"image_id": image_id})
+
+    def _release_dedup_marker(self, image_id: str, user_id: str, file_hash: str) -> None:
+        """Delete the dedup marker for an image if that image claimed it.
+
+        Raises:
+            ClientError: If deletion fails
+        """
+        try:
+            self._db.delete_item(
+                key={"image_id": self._dedup_marker_key(user_id=user_id, file_hash=file_hash)},
+                condition_expression=_DEDUP_IMAGE_ID_ATTR.eq(image_id),
+            )
+        except ClientError as exc:
+            if client_error_code(exc) != "ConditionalCheckFailedException":
+                raise
+
     def list_user_images(
         self,
         *,
@@ -177,62 +492,105 @@ class DynamoDBMetadata(ImageMetadataRepository):
         limit: int,
         start_date: str | None = None,
         end_date: str | None = None,
+        name_contains: str | None = None,
+        attributes: Iterable[str] | None = None,
     ) -> list[Metadata]:
-        """List images for a user with optional date filtering.
+        """List images for a user with optional date and name filtering.
 
         NOTE:
         - Date filtering is performed at the DynamoDB level.
+        - name_contains is applied as a FilterExpression on the lowercased
+          image name. Items written before that attribute existed are
+          passed through and must be filtered by the caller.
         - created_at must be stored in ISO-8601 UTC format.
         - Results are paginated internally but limited to `limit` items.
+        - Only `attributes` are returned (LIST_IMAGE_ATTRIBUTES by default).
         """
+        items = list(
+            self.iter_user_images(
+                user_id=user_id,
+                limit=limit,
+                start_date=start_date,
+                end_date=end_date,
+                name_contains=name_contains,
+                attributes=attributes,
+            )
+        )
 
-        logger.debug(
-            "Listing user images",
+        logger.info(
+            "User images listed",
             extra={
                 "user_id": user_id,
-                "limit": limit,
-                "start_date": start_date,
-                "end_date": end_date,
+                "count": len(items),
             },
         )
 
-        # Validate inputs
-        if limit < 1 or limit > MAX_LIMIT:
-            raise FilterError(
-                message="Limit must be between 1 and 100",
-                details={"limit": limit},
-            )
+        return items
 
-        if start_date and end_date and start_date > end_date:
-            raise FilterError(
-                message="Start date must be before end date",
-                details={"start_date": start_date, "end_date": end_date},
-            )
+    def iter_user_images(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        name_contains: str | None = None,
+        attributes: Iterable[str] | None = None,
+    ) -> Iterator[Metadata]:
+        """Yield up to `limit` of a user's images as query pages arrive.
+
+        Parameters are validated eagerly; DynamoDB is only queried as
+        the iterator is consumed, so a caller that stops early skips
+        the remaining round-trips. Errors surface during iteration.
 
-        # Build key condition expression
-        key_condition: ConditionBase = Key("user_id").eq(user_id)
+        Raises:
+            FilterError: If limit or dates are invalid
+            DynamoDBError: If query fails
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Listing user images",
+                extra={
+                    "user_id": user_id,
+                    "limit": limit,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "name_contains": name_contains,
+                },
+            )
 
-        if start_date and end_date:
-            key_condition &= Key("created_at").between(start_date, end_date)
-        elif start_date:
-            key_condition &= Key("created_at").gte(start_date)
-        elif end_date:
-            key_condition &= Key("created_at").lte(end_date)
+        self._validate_list_params(limit=limit, start_date=start_date, end_date=end_date)
 
         query_kwargs: dict[str, Any] = {
-            "IndexName": "user-created-index",
-            "KeyConditionExpression": key_condition,
+            "IndexName": USER_CREATED_INDEX,
+            "KeyConditionExpression": self._user_images_key_condition(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+            ),
             "ScanIndexForward": False,
-            "Limit": limit,
+            **self._projection(attributes),
         }
 
-        items: list[Metadata] = []
-        last_evaluated_key: dict[str, Any] | None = None
+        if name_contains and name_contains.strip():
+            query_kwargs["FilterExpression"] = self._name_contains_filter(name_contains)
+
+        return self._iter_user_images(user_id=user_id, limit=limit, query_kwargs=query_kwargs)
+
+    def _iter_user_images(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        query_kwargs: dict[str, Any],
+    ) -> Iterator[Metadata]:
+        """Run the list query page by page, yielding items as they arrive."""
+        remaining = limit
 
         try:
             while True:
-                if last_evaluated_key:
-                    query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+                # Only ask for what is still needed so no page over-fetches
+                query_kwargs["Limit"] = remaining
 
                 response = self._db.query(**query_kwargs)
                 page_items = response.get("Items", [])
@@ -244,27 +602,124 @@ class DynamoDBMetadata(ImageMetadataRepository):
                         details={"user_id": user_id},
                     )
 
-                items.extend(page_items)
-
-                # Stop if we've accumulated enough items
-                if len(items) >= limit:
-                    items = items[:limit]  # Trim to exact limit
-                    break
+                yield from page_items
+                remaining -= len(page_items)
 
-                # Continue paginating if there are more results
+                # Stop once the budget is spent or DynamoDB has no more pages
                 last_evaluated_key = response.get("LastEvaluatedKey")
-                if not last_evaluated_key:
+                if remaining <= 0 or not last_evaluated_key:
+                    return
+
+                query_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+        except ClientError as exc:
+            logger.error("DynamoDB query failed", extra={"user_id": user_id})
+
+            raise DynamoDBError(
+                message="Unable to list images for this user",
+                error_code=ERROR_CODE_METADATA_LIST_FAILED,
+                details={"user_id": user_id},
+            ) from exc
+
+        except Exception as exc:
+            logger.exception("Unexpected error listing images")
+            raise DynamoDBError(
+                message="Unable to list images for this user",
+                error_code=ERROR_CODE_METADATA_LIST_FAILED,
+                details={"user_id": user_id},
+            ) from exc
+
+    def list_user_images_page(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        name_contains: str | None = None,
+        exclusive_start_key: dict[str, Any] | None = None,
+        ascending: bool = False,
+        attributes: Iterable[str] | None = None,
+    ) -> tuple[list[Metadata], dict[str, Any] | None]:
+        """Fetch one page of a user's images using DynamoDB key pagination.
+
+        Only `limit` items are read per page, so cost scales with page
+        size rather than with the user's total image count. A
+        FilterExpression may drop items from a page, in which case
+        further pages are read until `limit` items are collected or the
+        index is exhausted. Only `attributes` are returned
+        (LIST_IMAGE_ATTRIBUTES by default).
+
+        Raises:
+            FilterError: If limit or dates are invalid
+            DynamoDBError: If query fails
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Listing user images page",
+                extra={
+                    "user_id": user_id,
+                    "limit": limit,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "name_contains": name_contains,
+                    "has_cursor": exclusive_start_key is not None,
+                },
+            )
+
+        self._validate_list_params(limit=limit, start_date=start_date, end_date=end_date)
+
+        key_condition = self._user_images_key_condition(
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+        query_kwargs: dict[str, Any] = {
+            "IndexName": USER_CREATED_INDEX,
+            "ScanIndexForward": ascending,
+            **self._projection(attributes),
+        }
+
+        if name_contains and name_contains.strip():
+            query_kwargs["FilterExpression"] = self._name_contains_filter(name_contains)
+
+        items: list[Metadata] = []
+        last_evaluated_key = exclusive_start_key
+
+        try:
+            while True:
+                # Never ask for more than the page still needs, so the
+                # last evaluated key is always a valid resume point
+                page_items, last_evaluated_key = self._db.paginate_query(
+                    key_condition=key_condition,
+                    limit=limit - len(items),
+                    exclusive_start_key=last_evaluated_key,
+                    **query_kwargs,
+                )
+
+                if not isinstance(page_items, list):
+                    raise DynamoDBError(
+                        message="Invalid query response from DynamoDB",
+                        error_code=ERROR_CODE_METADATA_LIST_FAILED,
+                        details={"user_id": user_id},
+                    )
+
+                items.extend(page_items)
+
+                if len(items) >= limit or not last_evaluated_key:
                     break
 
             logger.info(
-                "User images listed",
+                "User images page listed",
                 extra={
                     "user_id": user_id,
                     "count": len(items),
+                    "has_more": last_evaluated_key is not None,
                 },
             )
 
-            return items
+            return items, last_evaluated_key
 
         except ClientError as exc:
             logger.error("DynamoDB query failed", extra={"user_id": user_id})
@@ -288,27 +743,48 @@ class DynamoDBMetadata(ImageMetadataRepository):
         *,
         user_id: str,
         file_hash: str,
+        exclude_image_id: str | None = None,
     ) -> bool:
         """Check whether an image already exists for a user.
 
+        exclude_image_id ignores that image, so a just-written item can
+        look for older copies of its own content.
+
         BEHAVIOR ON ERROR:
         - If the check fails, an exception is raised (fail-closed approach)
         - This prevents silent duplicate uploads if DynamoDB is unavailable
         - This is the safer default for data integrity
 
+        CACHING:
+        - Only positive answers are cached, for a short TTL, since
+          other Lambda instances may create matching items at any time
+        - A cached answer is only probable: the cached image is read
+          back before True is returned, because another instance may
+          have deleted it; stale entries are dropped and the index is
+          queried as on a miss
+
         Raises:
             DynamoDBError: If check fails
         """
-        logger.debug(
-            "Checking for duplicate",
-            extra={"user_id": user_id, "file_hash": file_hash},
-        )
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Checking for duplicate",
+                extra={"user_id": user_id, "file_hash": file_hash},
+            )
 
         try:
+            if self._confirm_known_duplicate(user_id=user_id, file_hash=file_hash, exclude_image_id=exclude_image_id):
+                if logger.log_level <= logging.DEBUG:
+                    logger.debug("Cached duplicate confirmed", extra={"user_id": user_id})
+                return True
+
             response = self._db.query(
                 IndexName="user-filehash-index",
-                KeyConditionExpression=(Key("user_id").eq(user_id) & Key("file_hash").eq(file_hash)),
-                Limit=1,
+                KeyConditionExpression=(_USER_ID_KEY.eq(user_id) & _FILE_HASH_KEY.eq(file_hash)),
+                ProjectionExpression="image_id",
+                ReturnConsumedCapacity="NONE",
+                # One extra item leaves room for the excluded image
+                Limit=1 if exclude_image_id is None else 2,
             )
 
             items = response.get("Items", [])
@@ -320,11 +796,16 @@ class DynamoDBMetadata(ImageMetadataRepository):
                     details={"user_id": user_id},
                 )
 
-            is_duplicate = bool(items)
-            logger.debug(
-                "Duplicate check completed",
-                extra={"user_id": user_id, "is_duplicate": is_duplicate},
-            )
+            matches = [item for item in items if item.get("image_id") != exclude_image_id]
+            is_duplicate = bool(matches)
+            if is_duplicate:
+                self._known_duplicates.set((user_id, file_hash), matches[0].get("image_id", ""))
+
+            if logger.log_level <= logging.DEBUG:
+                logger.debug(
+                    "Duplicate check completed",
+                    extra={"user_id": user_id, "is_duplicate": is_duplicate},
+                )
             return is_duplicate
 
         except ClientError as exc:
@@ -345,3 +826,202 @@ class DynamoDBMetadata(ImageMetadataRepository):
                 error_code=ERROR_CODE_METADATA_DUPLICATE_CHECK_FAILED,
                 details={"user_id": user_id},
             ) from exc
+
+    def is_known_duplicate(self, *, user_id: str, file_hash: str) -> bool:
+        """Return True if this process recently saw the content stored.
+
+        DynamoDB is only read on a cache hit, to confirm the cached
+        image still exists. A False answer proves nothing; the atomic
+        write remains the authority, so a failed confirmation is
+        treated as a miss.
+        """
+        try:
+            return self._confirm_known_duplicate(user_id=user_id, file_hash=file_hash)
+        except ClientError:
+            logger.warning("Unable to confirm cached duplicate", extra={"user_id": user_id})
+            return False
+
+    def _confirm_known_duplicate(
+        self,
+        *,
+        user_id: str,
+        file_hash: str,
+        exclude_image_id: str | None = None,
+    ) -> bool:
+        """Read back a cached duplicate, forgetting it if it is gone.
+
+        Raises:
+            ClientError: If the read fails
+        """
+        cached_image_id = self._known_duplicates.get((user_id, file_hash))
+        if cached_image_id is None or cached_image_id == exclude_image_id:
+            return False
+
+        item = self._db.get_item(key={"image_id": cached_image_id}).get("Item")
+        if item is not None and item.get("file_hash") == file_hash:
+            return True
+
+        self._known_duplicates.discard_values({cached_image_id})
+        return False
+
+    def backfill_dedup_markers(self) -> int:
+        """Write the dedup marker missing from any stored image.
+
+        Images created before create_metadata_atomic_dedup have no
+        marker. Once every image has one, DEDUP_LEGACY_CHECK can be
+        turned off. Safe to re-run: existing markers are left alone.
+
+        Returns:
+            Number of markers written
+
+        Raises:
+            DynamoDBError: If the scan or a write fails
+        """
+        written = 0
+        scan_kwargs: dict[str, Any] = {
+            # Markers carry no file_hash, so only images are returned
+            "FilterExpression": Attr("file_hash").exists(),
+            "ProjectionExpression": "image_id, user_id, file_hash",
+        }
+
+        try:
+            while True:
+                response = self._db.scan(**scan_kwargs)
+
+                for item in response.get("Items", []):
+                    marker = {
+                        "image_id": self._dedup_marker_key(user_id=item["user_id"], file_hash=item["file_hash"]),
+                        "dedup_image_id": item["image_id"],
+                    }
+                    try:
+                        self._db.put_item(item=marker, condition_expression="attribute_not_exists(image_id)")
+                        written += 1
+                    except ClientError as exc:
+                        if client_error_code(exc) != "ConditionalCheckFailedException":
+                            raise
+                        # Already marked, by a new upload or an earlier
+                        # image holding the same content
+
+                last_evaluated_key = response.get("LastEvaluatedKey")
+                if not last_evaluated_key:
+                    break
+                scan_kwargs["ExclusiveStartKey"] = last_evaluated_key
+
+        except ClientError as exc:
+            logger.error("Dedup marker backfill failed", extra={"written": written})
+            raise DynamoDBError(
+                message="Unable to backfill dedup markers",
+                error_code=ERROR_CODE_METADATA_CREATE_FAILED,
+                details={"written": written},
+            ) from exc
+
+        logger.info("Dedup markers backfilled", extra={"written": written})
+        return written
+
+    @staticmethod
+    def _required_fields(metadata: Metadata) -> tuple[str, str, str]:
+        """Return (image_id, user_id, file_hash), validating each.
+
+        Raises:
+            ValueError: If any field is missing or not a non-empty string
+        """
+        image_id = metadata.get("image_id")
+        user_id = metadata.get("user_id")
+        file_hash = metadata.get("file_hash")
+
+        if not image_id or not isinstance(image_id, str) or not image_id.strip():
+            raise ValueError("metadata must contain non-empty 'image_id' (string)")
+
+        if not user_id or not isinstance(user_id, str) or not user_id.strip():
+            raise ValueError("metadata must contain non-empty 'user_id' (string)")
+
+        if not file_hash or not isinstance(file_hash, str) or not file_hash.strip():
+            raise ValueError("metadata must contain non-empty 'file_hash' (string)")
+
+        return image_id, user_id, file_hash
+
+    @staticmethod
+    def _build_item(metadata: Metadata) -> Metadata:
+        """Return the stored item, adding the lowercased image name."""
+        item = dict(metadata)
+        image_name = metadata.get("image_name")
+        if isinstance(image_name, str):
+            item[IMAGE_NAME_LOWER_ATTRIBUTE] = image_name.lower()
+        return item
+
+    @staticmethod
+    def _dedup_marker_key(*, user_id: str, file_hash: str) -> str:
+        """Return the partition key of a (user_id, file_hash) dedup marker."""
+        return f"{DEDUP_MARKER_PREFIX}{user_id}#{file_hash}"
+
+    @staticmethod
+    def _validate_list_params(
+        *,
+        limit: int,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> None:
+        """Validate shared list parameters."""
+        if limit < 1 or limit > MAX_LIMIT:
+            raise FilterError(
+                message="Limit must be between 1 and 100",
+                details={"limit": limit},
+            )
+
+        if start_date and end_date and start_date > end_date:
+            raise FilterError(
+                message="Start date must be before end date",
+                details={"start_date": start_date, "end_date": end_date},
+            )
+
+    @staticmethod
+    def _user_images_key_condition(
+        *,
+        user_id: str,
+        start_date: str | None,
+        end_date: str | None,
+    ) -> ConditionBase:
+        """Build the user/created_at key condition for the list index."""
+        key_condition: ConditionBase = _USER_ID_KEY.eq(user_id)
+
+        date_condition = DynamoDBMetadata._created_at_condition(start_date, end_date)
+        if date_condition is None:
+            return key_condition
+
+        return key_condition & date_condition
+
+    @staticmethod
+    def _created_at_condition(start_date: str | None, end_date: str | None) -> ConditionBase | None:
+        """Build the created_at range condition, or None when unbounded."""
+        match (bool(start_date), bool(end_date)):
+            case (True, True):
+                return _CREATED_AT_KEY.between(start_date, end_date)
+            case (True, False):
+                return _CREATED_AT_KEY.gte(start_date)
+            case (False, True):
+                return _CREATED_AT_KEY.lte(end_date)
+            case _:
+                return None
+
+    @staticmethod
+    def _name_contains_filter(name_contains: str) -> ConditionBase:
+        """Build the case-insensitive name FilterExpression.
+
+        Items without the lowercased name attribute are passed through
+        so callers can still match them in memory.
+        """
+        return _NAME_LOWER_ATTR.contains(name_contains.lower()) | _NAME_LOWER_ATTR.not_exists()
+
+    @staticmethod
+    def _projection(attributes: Iterable[str] | None) -> dict[str, Any]:
+        """Build ProjectionExpression query arguments.
+
+        Every attribute goes through a placeholder so reserved words
+        need no special casing. A fresh names mapping is returned on
+        each call because boto3 merges its own placeholders into it.
+        """
+        names = {f"#p{index}": name for index, name in enumerate(attributes or LIST_IMAGE_ATTRIBUTES)}
+        return {
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
@@ -1,33 +1,83 @@
 """S3-backed implementation of ImageStorageRepository."""
 
-from typing import Any
+from concurrent.futures import Future
+from functools import lru_cache
+import logging
+import time
+from typing import IO, Any, cast
+import warnings
 
 from aws_lambda_powertools import Logger
 from botocore.exceptions import ClientError
 
 from core.infrastructure.adapters.s3_adapter import S3Adapter, S3AdapterProtocol
+from core.infrastructure.aws.client_errors import client_error_code
 from core.models.errors import (
     NotFoundError,
     S3Error,
 )
 from core.repositories.storage_repository import ImageStorageRepository
+from core.utils.concurrency import IO_EXECUTOR
 from core.utils.constants import (
     ERROR_CODE_IMAGE_DELETE_FAILED,
     ERROR_CODE_IMAGE_DOWNLOAD_FAILED,
     ERROR_CODE_IMAGE_PRESIGNED_URL_FAILED,
     ERROR_CODE_IMAGE_UPLOAD_FAILED,
-    MIME_TYPE_EXTENSION_MAP,
+    MIME_TYPE_PRIMARY_EXTENSION,
 )
+from core.utils.ttl_cache import TTLCache
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
+
+_extension_of = MIME_TYPE_PRIMARY_EXTENSION.get
+
+
+# Pre-signed URLs are reused while they still have half their lifetime
+# left. Keys carry a time bucket that advances every expires_in / 2
+# seconds, so entries from past buckets are never served again; the
+# TTL only bounds how long they linger before eviction.
+PRESIGN_CACHE_SIZE = 4096
+PRESIGN_CACHE_TTL_SECONDS = 3600
+
+PresignedUrls = TTLCache[tuple[str, int, str | None, int], str]
+
+
+def _key_for(user_id: str, image_id: str, mime_type: str) -> str:
+    """Return the object key an image is stored under."""
+    return f"images/{user_id}/{image_id}.{_extension_of(mime_type, 'bin')}"
+
+
+@lru_cache(maxsize=1)
+def _default_adapter() -> S3AdapterProtocol:
+    """Return the adapter shared by default-constructed storages.
+
+    Services build a storage per invocation; sharing the adapter keeps
+    the S3 client and its connection pool warm across them.
+    """
+    return S3Adapter()
+
+
+def _new_presigned_urls() -> PresignedUrls:
+    return TTLCache(maxsize=PRESIGN_CACHE_SIZE, ttl=PRESIGN_CACHE_TTL_SECONDS)
+
+
+@lru_cache(maxsize=1)
+def _default_presigned_urls() -> PresignedUrls:
+    """Return the presigned URL cache shared alongside the default adapter."""
+    return _new_presigned_urls()
 
 
 class S3ImageStorage(ImageStorageRepository):
     """Image storage implementation backed by Amazon S3."""
 
     def __init__(self, adapter: S3AdapterProtocol | None = None) -> None:
-        """Create storage using the provided S3 adapter."""
-        self._s3: S3AdapterProtocol = adapter or S3Adapter()
+        """Create storage using the provided S3 adapter.
+
+        Storages on the default adapter share one presigned URL cache;
+        an injected adapter gets a private one.
+        """
+        self._s3: S3AdapterProtocol = adapter or _default_adapter()
+        self._presigned_urls = _default_presigned_urls() if adapter is None else _new_presigned_urls()
 
     def upload_image(
         self,
@@ -38,18 +88,18 @@ class S3ImageStorage(ImageStorageRepository):
         mime_type: str,
     ) -> str:
         """Upload image bytes to S3 and return the object key."""
-        extension = self._get_extension(mime_type)
-        key = f"images/{user_id}/{image_id}.{extension}"
-
-        logger.debug(
-            "Uploading image",
-            extra={
-                "image_id": image_id,
-                "user_id": user_id,
-                "key": key,
-                "size": len(file_data),
-            },
-        )
+        key = _key_for(user_id, image_id, mime_type)
+
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Uploading image",
+                extra={
+                    "image_id": image_id,
+                    "user_id": user_id,
+                    "key": key,
+                    "size": len(file_data),
+                },
+            )
 
         try:
             self._s3.put_object(
@@ -80,6 +130,27 @@ class S3ImageStorage(ImageStorageRepository):
                 details={"image_id": image_id},
             ) from exc
 
+    def upload_image_async(
+        self,
+        *,
+        image_id: str,
+        user_id: str,
+        file_data: bytes,
+        mime_type: str,
+    ) -> Future[str]:
+        """Run upload_image on the shared I/O pool and return its future."""
+        return IO_EXECUTOR.submit(
+            self.upload_image,
+            image_id=image_id,
+            user_id=user_id,
+            file_data=file_data,
+            mime_type=mime_type,
+        )
+
+    def build_key(self, *, image_id: str, user_id: str, mime_type: str) -> str:
+        """Return the object key an image is stored under."""
+        return _key_for(user_id, image_id, mime_type)
+
     def generate_presigned_get_url(
         self,
         *,
@@ -87,27 +158,38 @@ class S3ImageStorage(ImageStorageRepository):
         expires_in: int = 300,
         content_disposition: str | None = None,
     ) -> str:
-        """Generate a pre-signed S3 URL for reading an image object."""
-        logger.debug(
-            "Generating pre-signed S3 URL",
-            extra={"key": key, "expires_in": expires_in},
-        )
+        """Generate a pre-signed S3 URL for reading an image object.
+
+        Identical requests within half the expiry window return the same
+        cached URL.
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug(
+                "Generating pre-signed S3 URL",
+                extra={"key": key, "expires_in": expires_in},
+            )
 
         try:
-            params: dict[str, Any] = {"Key": key}
-
-            if content_disposition:
-                params["ResponseContentDisposition"] = content_disposition
-
-            url: str = self._s3.generate_presigned_url(
-                method="get_object",
-                params=params,
-                expires_in=expires_in,
-            )
+            time_bucket = int(time.time()) // max(expires_in // 2, 1)
+            cache_key = (key, expires_in, content_disposition, time_bucket)
+
+            url = self._presigned_urls.get(cache_key)
+            if url is None:
+                params: dict[str, Any] = {"Key": key}
+                if content_disposition:
+                    params["ResponseContentDisposition"] = content_disposition
+
+                url = self._s3.generate_presigned_url(
+                    method="get_object",
+                    params=params,
+                    expires_in=expires_in,
+                )
+                self._presigned_urls.set(cache_key, url)
 
             return url
+
         except ClientError as exc:
-            if exc.response.get("Error", {}).get("Code") == "NoSuchKey":
+            if client_error_code(exc) == "NoSuchKey":
                 raise NotFoundError(
                     message="Image not found",
                     details={"key": key},
@@ -128,27 +210,28 @@ class S3ImageStorage(ImageStorageRepository):
                 details={"key": key},
             ) from exc
 
-    def download_image(self, *, key: str) -> tuple[bytes, str, int]:
-        """Download image bytes directly from S3 (legacy path)."""
-        logger.debug("Downloading image (legacy)", extra={"key": key})
+    def open_image(self, *, key: str, byte_range: str | None = None) -> tuple[IO[bytes], str, int]:
+        """Open an image for streaming without reading its body.
+
+        The returned stream reads straight from the S3 response, so
+        memory stays constant regardless of object size. Callers must
+        close it once done. Pass an HTTP byte range (e.g. "bytes=0-1023")
+        when only the headers of the image are needed.
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Opening image stream", extra={"key": key, "byte_range": byte_range})
 
         try:
-            response = self._s3.get_object(key=key)
-            body = response["Body"].read()
+            response = self._s3.get_object(key=key, byte_range=byte_range)
             content_type = response.get("ContentType", "application/octet-stream")
-            content_length = response.get("ContentLength", len(body))
+            content_length = response.get("ContentLength", 0)
 
-            logger.info(
-                "Image downloaded successfully",
-                extra={"key": key, "size": content_length},
-            )
-
-            return body, content_type, content_length
+            return cast(IO[bytes], response["Body"]), content_type, content_length
 
         except ClientError as exc:
             logger.error("S3 download failed", extra={"key": key})
 
-            if exc.response.get("Error", {}).get("Code") == "NoSuchKey":
+            if client_error_code(exc) == "NoSuchKey":
                 raise NotFoundError(
                     message="Image not found",
                     details={"key": key},
@@ -160,6 +243,32 @@ class S3ImageStorage(ImageStorageRepository):
                 details={"key": key},
             ) from exc
 
+        except Exception as exc:
+            logger.exception("Unexpected error opening image")
+            raise S3Error(
+                message="Unable to download image at this time",
+                error_code=ERROR_CODE_IMAGE_DOWNLOAD_FAILED,
+                details={"key": key},
+            ) from exc
+
+    def download_image(self, *, key: str) -> tuple[bytes, str, int]:
+        """Download image bytes directly from S3 (legacy path).
+
+        Deprecated: proxying bytes through Lambda doubles the transfer.
+        Hand clients generate_presigned_get_url instead, and use
+        open_image when the bytes are needed server-side.
+        """
+        warnings.warn(
+            "download_image is deprecated; use generate_presigned_get_url or open_image",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        stream, content_type, content_length = self.open_image(key=key)
+
+        try:
+            body = stream.read()
+
         except Exception as exc:
             logger.exception("Unexpected error downloading image")
             raise S3Error(
@@ -168,9 +277,22 @@ class S3ImageStorage(ImageStorageRepository):
                 details={"key": key},
             ) from exc
 
+        finally:
+            stream.close()
+
+        content_length = content_length or len(body)
+
+        logger.info(
+            "Image downloaded successfully",
+            extra={"key": key, "size": content_length},
+        )
+
+        return body, content_type, content_length
+
     def remove_image(self, *, key: str) -> None:
         """Delete an image object from S3."""
-        logger.debug("Deleting image", extra={"key": key})
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Deleting image", extra={"key": key})
 
         try:
             self._s3.delete_object(key=key)
@@ -192,12 +314,44 @@ class S3ImageStorage(ImageStorageRepository):
                 details={"key": key},
             ) from exc
 
-    @staticmethod
-    def _get_extension(mime_type: str) -> str:
-        """Return file extension for a given MIME type."""
-        ext = MIME_TYPE_EXTENSION_MAP.get(mime_type)
-        if not ext:
-            return "bin"
+    def remove_images_bulk(self, *, keys: list[str]) -> dict[str, str]:
+        """Delete many image objects, up to 1000 per S3 request.
+
+        Returns:
+            Mapping of key to S3 error code for keys that could not be
+            deleted; empty when every delete succeeded.
+
+        Raises:
+            S3Error: If a batch request fails as a whole
+        """
+        if logger.log_level <= logging.DEBUG:
+            logger.debug("Deleting images in bulk", extra={"count": len(keys)})
+
+        try:
+            responses = self._s3.delete_objects(keys=keys)
+
+        except ClientError as exc:
+            logger.error("S3 bulk deletion failed", extra={"count": len(keys)})
+            raise S3Error(
+                message="Unable to delete images at this time",
+                error_code=ERROR_CODE_IMAGE_DELETE_FAILED,
+                details={"count": len(keys)},
+            ) from exc
+
+        except Exception as exc:
+            logger.exception("Unexpected error deleting images")
+            raise S3Error(
+                message="Unable to delete images at this time",
+                error_code=ERROR_CODE_IMAGE_DELETE_FAILED,
+                details={"count": len(keys)},
+            ) from exc
 
-        # MIME_TYPE_EXTENSION_MAP values are tuple[str, ...]
-        return ext[0]
+        failed = {
+            error["Key"]: error.get("Code", "Unknown") for response in responses for error in response.get("Errors", [])
+        }
+
+        logger.info(
+            "Images deleted in bulk",
+            extra={"deleted": len(keys) - len(failed), "failed_count": len(failed)},
+        )
+        return failed
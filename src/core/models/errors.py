@@ -1,6 +1,6 @@
 """Custom exception classes for the image service."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from core.utils.constants import (
     ERROR_CODE_DYNAMODB,
@@ -20,10 +20,13 @@ class ImageServiceError(Exception):
     Base exception for all image service errors.
 
     All custom errors must inherit from this class.
-    Callers must explicitly provide a message and error code.
+    Callers must explicitly provide a message; the error code may be
+    omitted only on subclasses that declare a `default_error_code`.
     Optional contextual information can be supplied via `details`.
     """
 
+    default_error_code: ClassVar[str | None] = None
+
     message: str
     error_code: str
     details: dict[str, Any]
@@ -32,9 +35,15 @@ class ImageServiceError(Exception):
         self,
         *,
         message: str,
-        error_code: str,
+        error_code: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
+        if error_code is None:
+            error_code = self.default_error_code
+
+        if error_code is None:
+            raise TypeError(f"{type(self).__name__} requires an explicit error_code")
+
         self.message = message
         self.error_code = error_code
         self.details = details or {}
@@ -45,151 +54,52 @@ class ImageServiceError(Exception):
 class ValidationError(ImageServiceError):
     """Raised when request validation fails."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_VALIDATION_FAILED,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_VALIDATION_FAILED
 
 
 class NotFoundError(ImageServiceError):
     """Raised when a requested resource is not found."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_RESOURCE_NOT_FOUND,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_RESOURCE_NOT_FOUND
 
 
 class DuplicateImageError(ImageServiceError):
     """Raised when a duplicate image is detected."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_IMAGE_DUPLICATE_IMAGE,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_IMAGE_DUPLICATE_IMAGE
 
 
 class MetadataOperationFailedError(ImageServiceError):
     """Raised when an image metadata operation fails."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_METADATA_OPERATION_FAILED,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_METADATA_OPERATION_FAILED
 
 
 class S3Error(ImageServiceError):
     """Raised when an image storage operation fails."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_S3,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_S3
 
 
 class DynamoDBError(ImageServiceError):
     """Raised when a DynamoDB operation fails."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_DYNAMODB,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_DYNAMODB
 
 
 class FilterError(ImageServiceError):
     """Raised when filter parameters are invalid."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_INVALID_FILTER,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_INVALID_FILTER
 
 
 class MIMETypeError(ImageServiceError):
     """Raised when an unsupported MIME type is provided."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_UNSUPPORTED_MIME_TYPE,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_UNSUPPORTED_MIME_TYPE
 
 
 class FileSizeError(ImageServiceError):
     """Raised when file size exceeds the allowed limit."""
 
-    def __init__(
-        self,
-        *,
-        message: str,
-        error_code: str = ERROR_CODE_FILE_SIZE_EXCEEDED,
-        details: dict[str, Any] | None = None,
-    ) -> None:
-        super().__init__(
-            message=message,
-            error_code=error_code,
-            details=details,
-        )
+    default_error_code = ERROR_CODE_FILE_SIZE_EXCEEDED
@@ -1,6 +1,6 @@
 """Pagination model."""
 
-from pydantic import BaseModel, Field, StrictBool, StrictInt
+from pydantic import BaseModel, Field, StrictBool, StrictInt, StrictStr
 
 
 class PaginationInfo(BaseModel):
@@ -13,3 +13,7 @@ class PaginationInfo(BaseModel):
         None,
         description="Offset to use for the next page, if available",
     )
+    next_cursor: StrictStr | None = Field(
+        None,
+        description="Opaque cursor to pass as `cursor` for the next page, if available",
+    )
@@ -1,6 +1,7 @@
 """Abstract contract for image metadata persistence."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 Metadata = dict[str, Any]
@@ -29,6 +30,18 @@ class ImageMetadataRepository(ABC):
             DynamoDBError: If creation fails for other reasons
         """
 
+    @abstractmethod
+    def create_metadata_atomic_dedup(self, *, metadata: Metadata) -> None:
+        """Create metadata, atomically rejecting duplicate content.
+
+        Args:
+            metadata: Image metadata dict, as for create_metadata
+
+        Raises:
+            DuplicateImageError: If the user already stored this content
+            DynamoDBError: If creation fails for other reasons
+        """
+
     @abstractmethod
     def fetch_metadata(self, *, image_id: str) -> Metadata | None:
         """Fetch metadata for a single image.
@@ -44,11 +57,47 @@ class ImageMetadataRepository(ABC):
         """
 
     @abstractmethod
-    def remove_metadata(self, *, image_id: str) -> None:
+    def fetch_metadata_bulk(self, *, image_ids: list[str]) -> dict[str, Metadata]:
+        """Fetch metadata for many images in batched requests.
+
+        Args:
+            image_ids: Unique image identifiers
+
+        Returns:
+            Mapping of image_id to metadata; missing ids are omitted
+
+        Raises:
+            DynamoDBError: If fetch fails
+        """
+
+    @abstractmethod
+    def remove_metadata(
+        self,
+        *,
+        image_id: str,
+        user_id: str | None = None,
+        file_hash: str | None = None,
+    ) -> None:
         """Remove metadata for an image.
 
         Args:
             image_id: Unique image identifier
+            user_id: Image owner; with file_hash, also releases the
+                content claimed by create_metadata_atomic_dedup
+            file_hash: Hash of image content
+
+        Raises:
+            DynamoDBError: If deletion fails
+        """
+
+    @abstractmethod
+    def remove_metadata_bulk(self, *, entries: list[tuple[str, str, str]]) -> None:
+        """Remove metadata for many images in batched requests.
+
+        Args:
+            entries: (image_id, user_id, file_hash) per image; as for
+                remove_metadata, the content each image claimed is
+                released too
 
         Raises:
             DynamoDBError: If deletion fails
@@ -62,14 +111,21 @@ class ImageMetadataRepository(ABC):
         limit: int,
         start_date: str | None = None,
         end_date: str | None = None,
+        name_contains: str | None = None,
+        attributes: Iterable[str] | None = None,
     ) -> list[Metadata]:
-        """List images for a user with optional date filtering.
+        """List images for a user with optional date and name filtering.
 
         Args:
             user_id: Image owner
             limit: Maximum results (1-100)
             start_date: Optional filter start date (ISO-8601 format)
             end_date: Optional filter end date (ISO-8601 format)
+            name_contains: Optional case-insensitive image name substring.
+                Implementations may return non-matching legacy items, so
+                callers should still refine results in memory.
+            attributes: Attributes to return; implementations choose a
+                default covering the list response when omitted
 
         Returns:
             List of metadata dicts, sorted newest first
@@ -80,12 +136,76 @@ class ImageMetadataRepository(ABC):
         """
 
     @abstractmethod
-    def check_duplicate_image(self, *, user_id: str, file_hash: str) -> bool:
+    def iter_user_images(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        name_contains: str | None = None,
+        attributes: Iterable[str] | None = None,
+    ) -> Iterator[Metadata]:
+        """Lazily yield a user's images, newest first.
+
+        Takes the same arguments as list_user_images. Results are
+        fetched as the iterator is consumed, so stopping early avoids
+        further queries.
+
+        Raises:
+            FilterError: If limit or dates are invalid
+            DynamoDBError: If query fails
+        """
+
+    @abstractmethod
+    def list_user_images_page(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        name_contains: str | None = None,
+        exclusive_start_key: dict[str, Any] | None = None,
+        ascending: bool = False,
+        attributes: Iterable[str] | None = None,
+    ) -> tuple[list[Metadata], dict[str, Any] | None]:
+        """Fetch one page of a user's images using key-based pagination.
+
+        Args:
+            user_id: Image owner
+            limit: Maximum results (1-100)
+            start_date: Optional filter start date (ISO-8601 format)
+            end_date: Optional filter end date (ISO-8601 format)
+            name_contains: Optional case-insensitive image name substring
+            exclusive_start_key: Key returned by the previous page, if any
+            ascending: Sort oldest first instead of newest first
+            attributes: Attributes to return; implementations choose a
+                default covering the list response when omitted
+
+        Returns:
+            A tuple of (items, last_evaluated_key). last_evaluated_key is
+            None when there are no further pages.
+
+        Raises:
+            FilterError: If limit or dates are invalid
+            DynamoDBError: If query fails
+        """
+
+    @abstractmethod
+    def check_duplicate_image(
+        self,
+        *,
+        user_id: str,
+        file_hash: str,
+        exclude_image_id: str | None = None,
+    ) -> bool:
         """Check whether an image already exists for a user.
 
         Args:
             user_id: Image owner
             file_hash: Hash of image content
+            exclude_image_id: Image to ignore, typically one just written
 
         Returns:
             True if duplicate exists for this user, False otherwise
@@ -93,3 +213,18 @@ class ImageMetadataRepository(ABC):
         Raises:
             DynamoDBError: If check fails
         """
+
+    def is_known_duplicate(self, *, user_id: str, file_hash: str) -> bool:
+        """Cheaply report content already known to be stored for a user.
+
+        Implementations without a local cache return False; a False
+        answer never rules out a duplicate.
+
+        Args:
+            user_id: Image owner
+            file_hash: Hash of image content
+
+        Returns:
+            True only if the content is known to be stored
+        """
+        return False
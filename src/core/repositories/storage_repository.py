@@ -1,6 +1,7 @@
 """Abstract contract for image file storage."""
 
 from abc import ABC, abstractmethod
+from typing import IO
 
 
 class ImageStorageRepository(ABC):
@@ -34,10 +35,30 @@ class ImageStorageRepository(ABC):
             S3Error: If upload fails
         """
 
+    @abstractmethod
+    def open_image(self, *, key: str, byte_range: str | None = None) -> tuple[IO[bytes], str, int]:
+        """Open image content as a stream without buffering it.
+
+        Args:
+            key: Storage key from upload
+            byte_range: Optional HTTP byte range, e.g. "bytes=0-1023"
+
+        Returns:
+            Tuple of (stream, content_type, content_length). The caller
+            reads the stream in chunks and must close it.
+
+        Raises:
+            NotFoundError: If image doesn't exist
+            S3Error: If the object cannot be opened
+        """
+
     @abstractmethod
     def download_image(self, *, key: str) -> tuple[bytes, str, int]:
         """Download image by key.
 
+        Deprecated: return a pre-signed URL to clients, or use
+        open_image when bytes are needed server-side.
+
         Args:
             key: Storage key from upload
 
@@ -59,3 +80,18 @@ class ImageStorageRepository(ABC):
         Raises:
             S3Error: If deletion fails
         """
+
+    @abstractmethod
+    def remove_images_bulk(self, *, keys: list[str]) -> dict[str, str]:
+        """Delete many images in batched requests.
+
+        Args:
+            keys: Storage keys from upload
+
+        Returns:
+            Mapping of key to error code for keys that could not be
+            deleted; empty when every delete succeeded
+
+        Raises:
+            S3Error: If a batch request fails as a whole
+        """
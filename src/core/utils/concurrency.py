@@ -0,0 +1,11 @@
+"""
+Shared thread pool for overlapping blocking AWS SDK calls.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+# Enough for the S3 + DynamoDB pair of one write path plus headroom
+IO_MAX_WORKERS = 4
+
+# Created once per Lambda container and reused by warm invocations
+IO_EXECUTOR = ThreadPoolExecutor(max_workers=IO_MAX_WORKERS, thread_name_prefix="aws-io")
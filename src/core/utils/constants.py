@@ -5,6 +5,8 @@ values that are used across multiple modules. Using constants prevents hardcodin
 values and makes it easy to change them globally.
 """
 
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Final
 
 # ============================================================================
@@ -64,6 +66,11 @@ MIME_TYPE_EXTENSION_MAP: Final[dict[str, tuple[str, ...]]] = {
     "image/svg+xml": ("svg",),
 }
 
+# First listed extension per MIME type, used when naming stored objects
+MIME_TYPE_PRIMARY_EXTENSION: Final[Mapping[str, str]] = MappingProxyType(
+    {mime: extensions[0] for mime, extensions in MIME_TYPE_EXTENSION_MAP.items()}
+)
+
 ALLOWED_MIME_TYPES: Final[frozenset[str]] = frozenset(MIME_TYPE_EXTENSION_MAP.keys())
 
 ALLOWED_EXTENSIONS: Final[frozenset[str]] = frozenset(
@@ -92,8 +99,29 @@ DEFAULT_OFFSET = 0
 # Filter Constraints
 # ============================================================================
 
-ALLOWED_SORT_FIELDS = {"created_at", "image_name"}
-ALLOWED_SORT_ORDERS = {"asc", "desc"}
+ALLOWED_SORT_FIELDS: Final[frozenset[str]] = frozenset({"created_at", "image_name"})
+ALLOWED_SORT_ORDERS: Final[frozenset[str]] = frozenset({"asc", "desc"})
+
+# Lowercased copy of image_name, written at ingest so name_contains
+# can be evaluated by DynamoDB as a FilterExpression
+IMAGE_NAME_LOWER_ATTRIBUTE = "image_name_lower"
+
+# Attributes projected by list queries: everything the list response
+# needs plus the lowercased name for in-memory name filtering, leaving
+# out ingest-only fields such as file_hash
+LIST_IMAGE_ATTRIBUTES: Final[tuple[str, ...]] = (
+    "image_id",
+    "user_id",
+    "image_name",
+    IMAGE_NAME_LOWER_ATTRIBUTE,
+    "description",
+    "tags",
+    "created_at",
+    "updated_at",
+    "s3_key",
+    "file_size",
+    "mime_type",
+)
 
 # ============================================================================
 # Date / Time Formats
@@ -118,11 +146,16 @@ BINARY_CONTENT_TYPE_HEADER = "Content-Type"
 # ============================================================================
 
 ENV_AWS_ENDPOINT_URL = "AWS_ENDPOINT_URL"
+# Service-specific overrides, named as botocore's own variables
+ENV_AWS_ENDPOINT_URL_DYNAMODB = "AWS_ENDPOINT_URL_DYNAMODB"
+ENV_AWS_ENDPOINT_URL_S3 = "AWS_ENDPOINT_URL_S3"
 ENV_IMAGE_S3_BUCKET_NAME = "IMAGE_S3_BUCKET_NAME"
 ENV_IMAGE_METADATA_TABLE_NAME = "IMAGE_METADATA_TABLE_NAME"
 ENV_ENVIRONMENT = "ENVIRONMENT"
 ENV_AWS_REGION = "us-east-1"
 ENV_APP_RUNTIME = "APP_RUNTIME"
+# "true" while images stored before dedup markers may lack one
+ENV_DEDUP_LEGACY_CHECK = "DEDUP_LEGACY_CHECK"
 LOCALSTACK_URL = "http://localstack"
 LOCALHOST_URL = "http://localhost"
 
@@ -131,6 +164,9 @@ LOCALHOST_URL = "http://localhost"
 # ============================================================================
 
 
+_SIZE_UNITS: Final[tuple[str, ...]] = ("B", "KB", "MB", "GB", "TB")
+
+
 def get_max_file_size_mb() -> int:
     """Get maximum file size in megabytes."""
     return MAX_FILE_SIZE // (1024 * 1024)
@@ -145,11 +181,10 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted file size string
     """
-    size: float = float(size_bytes)
+    if size_bytes < 1024:
+        return f"{size_bytes:.1f} B"
 
-    for unit in ("B", "KB", "MB", "GB"):
-        if size < 1024.0:
-            return f"{size:.1f} {unit}"
-        size /= 1024.0
+    # Each unit spans 10 bits, so the bit length picks it directly
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
-    return f"{size:.1f} TB"
+    return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
@@ -0,0 +1,40 @@
+"""
+Opaque pagination cursors wrapping DynamoDB LastEvaluatedKey values.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any
+
+Cursor = dict[str, Any]
+
+# LastEvaluatedKey attributes for the user-created-index query
+CURSOR_KEY_FIELDS = frozenset({"image_id", "user_id", "created_at"})
+
+
+def encode_cursor(key: Cursor) -> str:
+    """Encode a DynamoDB key as a URL-safe cursor string."""
+    raw = json.dumps(key, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """Decode a cursor produced by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or is not a
+            user-created-index key
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+
+    if not isinstance(key, dict) or set(key) != CURSOR_KEY_FIELDS:
+        raise ValueError("Invalid pagination cursor")
+
+    if not all(isinstance(value, str) for value in key.values()):
+        raise ValueError("Invalid pagination cursor")
+
+    return key
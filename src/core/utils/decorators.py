@@ -4,7 +4,6 @@ Common decorators and helpers for API Gateway Lambda handlers.
 
 from __future__ import annotations
 
-import traceback
 from collections.abc import Callable
 from functools import wraps
 from http import HTTPStatus
@@ -13,10 +12,24 @@ from aws_lambda_powertools import Logger
 
 from core.utils.response import ResponseBuilder
 
-logger = Logger(service="api-gateway-handler", UTC=True)
+logger = Logger(service="api-gateway-handler", utc=True)
 
 JsonDict = dict[str, Any]
 
+# Exception messages starting with these are already fit to show users
+_FRIENDLY_PREFIXES = (
+    "Invalid",
+    "Missing",
+    "Required",
+    "Must",
+    "Cannot",
+    "Unable to",
+    "Failed to",
+    "Image",
+    "File",
+    "User",
+)
+
 
 class ApiGatewayHandlerProtocol(Protocol):
     """Protocol for API Gateway Lambda handler functions."""
@@ -40,20 +53,7 @@ def _get_user_friendly_message(exc: Exception) -> str:
     
     # If the exception message is already user-friendly (starts with common phrases),
     # keep it as is
-    friendly_prefixes = (
-        "Invalid",
-        "Missing",
-        "Required",
-        "Must",
-        "Cannot",
-        "Unable to",
-        "Failed to",
-        "Image",
-        "File",
-        "User",
-    )
-    
-    if exc_str and any(exc_str.startswith(prefix) for prefix in friendly_prefixes):
+    if exc_str and exc_str.startswith(_FRIENDLY_PREFIXES):
         return exc_str
     
     # Default friendly messages by exception type
@@ -108,9 +108,9 @@ def _log_error(
         # logger.exception automatically includes traceback
         logger.exception(message, extra=log_extra)
     else:
-        # For warnings, manually add traceback
-        log_extra["traceback"] = traceback.format_exc()
-        logger.warning(message, extra=log_extra)
+        # exc_info lets the formatter render the traceback only when
+        # the record is actually emitted
+        logger.warning(message, extra=log_extra, exc_info=exc)
 
 
 def api_gateway_handler(
@@ -141,11 +141,7 @@ def api_gateway_handler(
     ) -> JsonDict:
         # Handle CORS preflight requests
         if event.get("httpMethod") == "OPTIONS":
-            return {
-                "statusCode": HTTPStatus.NO_CONTENT.value,
-                "headers": ResponseBuilder._build_headers(cors_origin),
-                "body": "",
-            }
+            return ResponseBuilder.no_content(cors_origin=cors_origin)
 
         request_id = getattr(context, "aws_request_id", None)
 
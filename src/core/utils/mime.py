@@ -8,10 +8,33 @@ MAGIC_BYTES: Mapping[bytes, str] = {
     b"RIFF": "image/webp",
 }
 
+# RIFF is a generic container (AVI, WAV, ...); WebP names itself at bytes 8-12
+_WEBP_FOURCC = b"WEBP"
+
+
+def _group_by_length(signatures: Mapping[bytes, str]) -> tuple[tuple[int, Mapping[bytes, str]], ...]:
+    grouped: dict[int, dict[bytes, str]] = {}
+
+    for signature, mime in signatures.items():
+        grouped.setdefault(len(signature), {})[signature] = mime
+
+    # Longest first, so a longer signature wins over a shorter prefix of it
+    return tuple(sorted(grouped.items(), reverse=True))
+
+
+# One slice and one dict lookup per distinct signature length
+_MAGIC_BY_LENGTH = _group_by_length(MAGIC_BYTES)
+
 
 def detect_mime_type(file_data: bytes) -> str:
-    for signature, mime in MAGIC_BYTES.items():
-        if file_data.startswith(signature):
-            return mime
+    for length, signatures in _MAGIC_BY_LENGTH:
+        mime = signatures.get(file_data[:length])
+        if mime is None:
+            continue
+
+        if mime == "image/webp" and file_data[8:12] != _WEBP_FOURCC:
+            break
+
+        return mime
 
     raise ValueError("Unsupported or unknown file type")
@@ -0,0 +1,57 @@
+"""
+multipart/form-data parsing for API Gateway proxy events.
+"""
+
+from email.parser import BytesParser
+from email.policy import HTTP
+
+MULTIPART_FORM_DATA = "multipart/form-data"
+
+FormFields = dict[str, str | bytes]
+
+
+def is_multipart(content_type: str) -> bool:
+    """Return True if the Content-Type header denotes multipart/form-data."""
+    return content_type.lower().startswith(MULTIPART_FORM_DATA)
+
+
+def parse_multipart_form(body: bytes, content_type: str) -> FormFields:
+    """Parse a multipart/form-data body into a field mapping.
+
+    File parts (parts carrying a filename) are returned as raw bytes,
+    all other parts are decoded to text. When a field is repeated,
+    the last value wins.
+
+    Args:
+        body: Raw request body
+        content_type: Request Content-Type header, including the boundary
+
+    Returns:
+        Mapping of form field name to value
+
+    Raises:
+        ValueError: If the body is not a valid multipart/form-data payload
+    """
+    header = f"Content-Type: {content_type}\r\n\r\n".encode("latin-1")
+    message = BytesParser(policy=HTTP).parsebytes(header + body)
+
+    if not message.is_multipart() or message.defects:
+        raise ValueError("Invalid multipart/form-data body")
+
+    fields: FormFields = {}
+
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if not isinstance(name, str):
+            continue
+
+        payload = part.get_payload(decode=True)
+        if not isinstance(payload, bytes):
+            payload = b""
+
+        if part.get_filename() is None:
+            fields[name] = payload.decode(part.get_content_charset() or "utf-8")
+        else:
+            fields[name] = payload
+
+    return fields
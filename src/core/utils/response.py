@@ -5,10 +5,13 @@ Centralized API response builder for AWS Lambda / API Gateway.
 from __future__ import annotations
 
 import base64
+from decimal import Decimal
 from http import HTTPStatus
-import json
 from typing import Any
 
+from pydantic import BaseModel
+from pydantic_core import to_json
+
 from core.utils.constants import (
     CORS_HEADERS,
     CORS_METHODS,
@@ -21,6 +24,34 @@ from core.utils.time import utc_now_iso
 
 JsonDict = dict[str, Any]
 
+# Non text/* content types that API Gateway can pass through as plain text
+_TEXTUAL_CONTENT_TYPES = frozenset({"application/json", "application/xml", "image/svg+xml"})
+
+
+def _is_textual(content_type: str) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith("text/") or media_type in _TEXTUAL_CONTENT_TYPES
+
+
+def _json_numbers(value: Any) -> Any:
+    """Return value with Decimals converted to JSON numbers.
+
+    pydantic-core encodes Decimal as a string, so DynamoDB numbers are
+    converted here to stay numbers on the wire.
+
+    Raises:
+        TypeError: If a Decimal is NaN or infinite
+    """
+    if isinstance(value, Decimal):
+        if not value.is_finite():
+            raise TypeError(f"Decimal {value} is not JSON serializable")
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, dict):
+        return {key: _json_numbers(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_json_numbers(item) for item in value]
+    return value
+
 
 class ResponseBuilder:
     """Factory for API Gateway-compatible HTTP responses."""
@@ -36,12 +67,13 @@ class ResponseBuilder:
         "Access-Control-Expose-Headers": EXPOSE_HEADERS,
     }
 
+    # Every JSON response carries both sets; merged once so each response
+    # only pays for a single copy
+    _MERGED_HEADERS: dict[str, str] = {**DEFAULT_HEADERS, **DEFAULT_CORS_HEADERS}
+
     @staticmethod
     def _build_headers(cors_origin: str | None = None) -> dict[str, str]:
-        headers: dict[str, str] = dict(ResponseBuilder.DEFAULT_HEADERS)
-
-        # Always include CORS headers
-        headers.update(ResponseBuilder.DEFAULT_CORS_HEADERS)
+        headers: dict[str, str] = dict(ResponseBuilder._MERGED_HEADERS)
 
         # Allow override (for future multi-origin support)
         if cors_origin:
@@ -53,29 +85,37 @@ class ResponseBuilder:
     def _response(
         *,
         status: HTTPStatus,
-        body: JsonDict | None = None,
+        body: JsonDict | BaseModel | None = None,
         request_id: str | None = None,
         cors_origin: str | None = None,
     ) -> JsonDict:
-        payload: JsonDict = {}
-
-        if body:
-            payload.update(body)
-
-        if request_id:
-            payload["request_id"] = request_id
+        # Models serialize straight to JSON in pydantic-core, skipping the
+        # intermediate dict and the stdlib encoder
+        if isinstance(body, BaseModel):
+            if not request_id:
+                return {
+                    "statusCode": status.value,
+                    "headers": ResponseBuilder._build_headers(cors_origin),
+                    "body": body.model_dump_json(),
+                }
+
+            body = body.model_dump()
+        elif body:
+            body = _json_numbers(body)
+
+        payload: JsonDict = {**(body or {}), "request_id": request_id} if request_id else body or {}
 
         response: JsonDict = {
             "statusCode": status.value,
             "headers": ResponseBuilder._build_headers(cors_origin),
-            "body": json.dumps(payload),
+            "body": to_json(payload).decode("utf-8"),
         }
 
         return response
 
     @staticmethod
     def ok(
-        body: JsonDict,
+        body: JsonDict | BaseModel,
         *,
         request_id: str | None = None,
         cors_origin: str | None = None,
@@ -89,7 +129,7 @@ class ResponseBuilder:
 
     @staticmethod
     def created(
-        body: JsonDict,
+        body: JsonDict | BaseModel,
         *,
         request_id: str | None = None,
         cors_origin: str | None = None,
@@ -247,9 +287,21 @@ class ResponseBuilder:
         if headers:
             response_headers.update(headers)
 
+        # Text bodies skip the base64 round trip and its ~33% size overhead
+        if _is_textual(content_type):
+            try:
+                return {
+                    "statusCode": HTTPStatus.OK.value,
+                    "headers": response_headers,
+                    "body": content.decode("utf-8"),
+                    "isBase64Encoded": False,
+                }
+            except UnicodeDecodeError:
+                pass
+
         return {
             "statusCode": HTTPStatus.OK.value,
             "headers": response_headers,
-            "body": base64.b64encode(content).decode("utf-8"),
+            "body": base64.b64encode(content).decode("ascii"),
             "isBase64Encoded": True,
         }
@@ -8,6 +8,9 @@ correct lexicographic ordering in DynamoDB.
 
 from datetime import datetime, timezone
 
+_UTC = timezone.utc
+_now = datetime.now
+
 
 def utc_now_iso() -> str:
     """Return current UTC time in ISO-8601 format.
@@ -19,5 +22,8 @@ def utc_now_iso() -> str:
     - DynamoDB range key comparisons
     - Sorting
     - JSON serialization
+
+    Microseconds are always written, so every timestamp has the same
+    width even when the clock lands on a whole second.
     """
-    return datetime.now(timezone.utc).isoformat()
+    return _now(_UTC).isoformat(timespec="microseconds")
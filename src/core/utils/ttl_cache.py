@@ -0,0 +1,63 @@
+"""
+Small thread-safe LRU cache whose entries expire after a fixed time.
+"""
+
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Hashable
+from threading import Lock
+import time
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded mapping that forgets entries `ttl` seconds after they are set.
+
+    The least recently used entry is evicted once `maxsize` is reached.
+    Safe to share between the worker threads of one process.
+    """
+
+    def __init__(self, *, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: K) -> V | None:
+        """Return the live value for key, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value under key, restarting its time to live."""
+        with self._lock:
+            self._entries[key] = (value, self._clock() + self._ttl)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_values(self, values: Collection[V]) -> None:
+        """Drop every entry whose value is in values."""
+        with self._lock:
+            stale = [key for key, (value, _) in self._entries.items() if value in values]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
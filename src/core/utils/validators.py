@@ -7,6 +7,14 @@ from pydantic import BaseModel
 
 ModelT = TypeVar("ModelT", bound=BaseModel)
 
+# (substring of the lowercased pydantic message, user-facing replacement);
+# the first matching rule wins
+_MESSAGE_RULES: tuple[tuple[str, str], ...] = (
+    ("base64", "File must be a valid Base64-encoded string"),
+    ("field required", "This field is required"),
+    ("type", "Invalid value type"),
+)
+
 
 def sanitize_validation_errors(
     errors: Sequence[Mapping[str, Any]],
@@ -25,12 +33,10 @@ def sanitize_validation_errors(
         msg = raw_msg.replace("Value error,", "").strip()
         msg_lower = msg.lower()
 
-        if "base64" in msg_lower:
-            msg = "File must be a valid Base64-encoded string"
-        elif "field required" in msg_lower:
-            msg = "This field is required"
-        elif "type" in msg_lower:
-            msg = "Invalid value type"
+        for needle, replacement in _MESSAGE_RULES:
+            if needle in msg_lower:
+                msg = replacement
+                break
 
         sanitized.append(
             {
@@ -58,5 +64,6 @@ def validate_request(
     Raises:
         ValidationError: If validation fails
     """
-    instance: ModelT = model(**data)
-    return instance
+    # model_validate hands the dict straight to the compiled validator,
+    # skipping the kwargs repack of model(**data)
+    return model.model_validate(data)
@@ -20,7 +20,7 @@ from core.utils.validators import sanitize_validation_errors, validate_request
 from .models import DeleteImageRequest, DeleteImageResponse
 from .service import DeleteService
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 tracer = Tracer()
 metrics = Metrics()
 
@@ -18,7 +18,7 @@ from core.models.errors import (
 )
 from core.utils.time import utc_now_iso
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 
 class DeleteService:
@@ -110,7 +110,11 @@ class DeleteService:
 
         # Step 3: Delete metadata from the database
         try:
-            self.metadata.remove_metadata(image_id=image_id)
+            self.metadata.remove_metadata(
+                image_id=image_id,
+                user_id=metadata.get("user_id"),
+                file_hash=metadata.get("file_hash"),
+            )
         except Exception as exc:
             logger.exception(
                 "Failed to delete image metadata",
@@ -26,7 +26,7 @@ from core.utils.constants import (
 
 Metadata = dict[str, Any]
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 IS_LOCALSTACK = os.getenv(ENV_APP_RUNTIME) == "localstack"
 
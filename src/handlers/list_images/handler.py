@@ -17,7 +17,7 @@ from core.utils.validators import sanitize_validation_errors, validate_request
 from .models import ListImagesRequest
 from .service import ListService
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 tracer = Tracer()
 metrics = Metrics()
 
@@ -31,8 +31,9 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
 
     Supports:
     - Filtering by creation date (DynamoDB-level)
-    - Filtering by image name substring (in-memory)
-    - Sorting and offset-based pagination
+    - Filtering by image name substring (DynamoDB FilterExpression)
+    - In-memory sorting and offset-based pagination (default)
+    - Cursor-based pagination over DynamoDB keys (pagination=cursor)
 
     Args:
         event: API Gateway Lambda proxy event
@@ -75,17 +76,34 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
 
     service = ListService()
 
+    next_cursor: str | None = None
+
     try:
-        items, total_count, has_more = service.list_images(
-            user_id=request.user_id,
-            name_contains=request.name_contains,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            offset=request.offset,
-            limit=request.limit,
-            sort_by=request.sort_by,
-            sort_order=request.sort_order,
-        )
+        if request.uses_cursor:
+            items, next_cursor = service.list_images_page(
+                user_id=request.user_id,
+                name_contains=request.name_contains,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                limit=request.limit,
+                cursor=request.cursor,
+                sort_order=request.sort_order,
+            )
+            # Counting every match would read the whole index, so in
+            # cursor mode total_count covers the current page only
+            total_count = len(items)
+            has_more = next_cursor is not None
+        else:
+            items, total_count, has_more = service.list_images(
+                user_id=request.user_id,
+                name_contains=request.name_contains,
+                start_date=request.start_date,
+                end_date=request.end_date,
+                offset=request.offset,
+                limit=request.limit,
+                sort_by=request.sort_by,
+                sort_order=request.sort_order,
+            )
     except ValueError as exc:
         logger.exception("Error listing images")
         return ResponseBuilder.bad_request(str(exc))
@@ -111,18 +129,21 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
         except Exception as exc:
             logger.warning("Skipping malformed item", exc_info=exc)
 
-    next_offset = request.offset + len(images) if has_more else None
+    next_offset = request.offset + len(images) if has_more and not request.uses_cursor else None
 
-    response = ListImagesResponse(
+    # Rows are validated individually above and the paging values come from
+    # the validated request, so the envelope is assembled without a second pass
+    response = ListImagesResponse.model_construct(
         images=images,
         total_count=total_count,
         returned_count=len(images),
-        pagination=PaginationInfo(
+        pagination=PaginationInfo.model_construct(
             limit=request.limit,
             offset=request.offset,
             has_more=has_more,
             next_offset=next_offset,
+            next_cursor=next_cursor,
         ),
     )
 
-    return ResponseBuilder.ok(response.model_dump())
+    return ResponseBuilder.ok(response)
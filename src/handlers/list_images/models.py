@@ -16,7 +16,7 @@ class ListImagesRequest(BaseModel):
 
     Supports two filters:
     - Date range (start_date, end_date) → DynamoDB-level
-    - Image name substring (name_contains) → in-memory
+    - Image name substring (name_contains) → DynamoDB FilterExpression
     """
 
     model_config = ConfigDict(str_strip_whitespace=True)
@@ -24,7 +24,7 @@ class ListImagesRequest(BaseModel):
     # User identifier
     user_id: str = Field(..., min_length=3, max_length=50)
 
-    # Filter 1: Name-based (in-memory filtering)
+    # Filter 1: Name-based (DynamoDB FilterExpression)
     name_contains: str | None = Field(
         None,
         description="Substring match on image name",
@@ -52,6 +52,14 @@ class ListImagesRequest(BaseModel):
         ge=0,
         description="Pagination offset",
     )
+    cursor: str | None = Field(
+        None,
+        description="Opaque cursor returned as next_cursor by the previous page",
+    )
+    pagination: Literal["offset", "cursor"] = Field(
+        default="offset",
+        description="Pagination mode; cursor pages with DynamoDB keys",
+    )
 
     # Sorting
     sort_by: Literal["created_at", "image_name"] = Field(
@@ -130,3 +138,15 @@ class ListImagesRequest(BaseModel):
             if self.start_date > self.end_date:
                 raise ValueError("start_date must be before or equal to end_date")
         return self
+
+    @model_validator(mode="after")
+    def validate_cursor(self) -> "ListImagesRequest":
+        """Ensure cursor pagination is not mixed with offset or name sorting."""
+        if self.uses_cursor and (self.offset or self.sort_by != "created_at"):
+            raise ValueError("cursor pagination cannot be combined with offset or sort_by other than created_at")
+        return self
+
+    @property
+    def uses_cursor(self) -> bool:
+        """Whether the client opted in to key-based pagination."""
+        return self.cursor is not None or self.pagination == "cursor"
@@ -9,10 +9,12 @@ from aws_lambda_powertools import Logger
 from core.filters.in_memory_image_filter import InMemoryImageFilter
 from core.infrastructure.aws.dynamodb_metadata import DynamoDBMetadata
 from core.models.errors import FilterError, MetadataOperationFailedError
+from core.utils.constants import ERROR_CODE_METADATA_LIST_FAILED, MAX_LIMIT
+from core.utils.cursor import decode_cursor, encode_cursor
 
 Metadata = dict[str, Any]
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 
 class ListService:
@@ -22,6 +24,10 @@ class ListService:
     - Fetching image metadata from DynamoDB
     - Applying optional in-memory refinement filters
     - Sorting and paginating results
+
+    list_images serves offset pagination and in-memory sorting.
+    list_images_page serves clients that opt in to cursor pagination:
+    it pages with DynamoDB keys, so only one page of items is read.
     """
 
     def __init__(self) -> None:
@@ -43,30 +49,32 @@ class ListService:
     ) -> tuple[list[Metadata], int, bool]:
         """List images with filtering, sorting, and pagination."""
 
-        if limit < 1 or limit > 100:
+        if limit < 1 or limit > MAX_LIMIT:
             raise FilterError(
                 message="Limit must be between 1 and 100",
                 details={"limit": limit},
             )
 
         try:
-            # Step 1: Fetch from DynamoDB (date filtering only)
+            # Step 1: Fetch from DynamoDB (date and name filtering)
             items = self.metadata.list_user_images(
                 user_id=user_id,
                 limit=limit,
                 start_date=start_date,
                 end_date=end_date,
+                name_contains=name_contains,
             )
 
         except Exception as exc:
             logger.exception("Failed to fetch metadata")
             raise MetadataOperationFailedError(
                 message="Unable to retrieve images",
-                error_code="METADATA_LIST_FAILED",
+                error_code=ERROR_CODE_METADATA_LIST_FAILED,
                 details={"user_id": user_id},
             ) from exc
 
-        # Step 2: Apply in-memory name filtering only if requested
+        # Step 2: Re-check names in memory for legacy items that predate
+        # the lowercased name attribute and pass the DynamoDB filter
         if name_contains:
             items = self.filters.filter_by_name_contains(
                 items,
@@ -100,6 +108,73 @@ class ListService:
 
         return page_items, total, has_more
 
+    def list_images_page(
+        self,
+        *,
+        user_id: str,
+        name_contains: str | None,
+        start_date: str | None,
+        end_date: str | None,
+        limit: int,
+        cursor: str | None,
+        sort_order: str | None,
+    ) -> tuple[list[Metadata], str | None]:
+        """List one page of images ordered by creation date.
+
+        Returns:
+            A tuple of (items, next_cursor). next_cursor is None on the
+            last page.
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to another user
+        """
+        if limit < 1 or limit > MAX_LIMIT:
+            raise FilterError(
+                message="Limit must be between 1 and 100",
+                details={"limit": limit},
+            )
+
+        exclusive_start_key = decode_cursor(cursor) if cursor else None
+
+        if exclusive_start_key and exclusive_start_key["user_id"] != user_id:
+            raise ValueError("Invalid pagination cursor")
+
+        try:
+            items, last_evaluated_key = self.metadata.list_user_images_page(
+                user_id=user_id,
+                limit=limit,
+                start_date=start_date,
+                end_date=end_date,
+                name_contains=name_contains,
+                exclusive_start_key=exclusive_start_key,
+                ascending=sort_order == "asc",
+            )
+
+        except Exception as exc:
+            logger.exception("Failed to fetch metadata page")
+            raise MetadataOperationFailedError(
+                message="Unable to retrieve images",
+                error_code=ERROR_CODE_METADATA_LIST_FAILED,
+                details={"user_id": user_id},
+            ) from exc
+
+        # Re-check names in memory for legacy items that predate the
+        # lowercased name attribute and pass the DynamoDB filter
+        if name_contains:
+            items = self.filters.filter_by_name_contains(
+                items,
+                name_contains=name_contains,
+            )
+
+        next_cursor = encode_cursor(last_evaluated_key) if last_evaluated_key else None
+
+        logger.info(
+            "Images page listed successfully",
+            extra={"user_id": user_id, "count": len(items), "has_more": next_cursor is not None},
+        )
+
+        return items, next_cursor
+
     @staticmethod
     def _sort_items(
         items: list[Metadata],
@@ -2,6 +2,8 @@
 Lambda handler responsible for image upload and metadata creation.
 """
 
+import base64
+import binascii
 from http import HTTPStatus
 import json
 from typing import Any
@@ -17,13 +19,14 @@ from core.models.errors import (
     ValidationError,
 )
 from core.utils.decorators import api_gateway_handler
+from core.utils.multipart import is_multipart, parse_multipart_form
 from core.utils.response import ResponseBuilder
 from core.utils.validators import sanitize_validation_errors, validate_request
 
 from .models import ImageUploadRequest, ImageUploadResponse
 from .service import UploadService
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 tracer = Tracer()
 metrics = Metrics()
 
@@ -35,15 +38,22 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     """
     Handle image upload requests.
 
-    The handler decodes base64-encoded image data, validates the incoming
-    payload, uploads the image to storage, and returns metadata describing
-    the newly created image resource.
+    The handler accepts either a JSON body carrying base64-encoded image
+    data or a multipart/form-data body carrying the raw image bytes,
+    validates the incoming payload, uploads the image to storage, and
+    returns metadata describing the newly created image resource.
 
     Expected API Gateway event structure:
     {
         "body": "{...}",           # JSON string containing upload data
         "isBase64Encoded": false
     }
+    or, for multipart uploads (binary media type):
+    {
+        "headers": {"Content-Type": "multipart/form-data; boundary=..."},
+        "body": "<base64 multipart body>",
+        "isBase64Encoded": true
+    }
 
     Args:
         event: API Gateway Lambda proxy event containing the upload payload
@@ -66,11 +76,23 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
         },
     )
 
-    try:
-        body = json.loads(event.get("body") or "{}")
-    except json.JSONDecodeError as exc:
-        logger.exception("Invalid JSON body received", exc_info=exc)
-        return ResponseBuilder.bad_request(message="Invalid JSON body")
+    headers = {key.lower(): value for key, value in (event.get("headers") or {}).items()}
+    content_type: str = headers.get("content-type") or ""
+
+    if is_multipart(content_type):
+        try:
+            raw_body = event.get("body") or ""
+            body_bytes = base64.b64decode(raw_body) if event.get("isBase64Encoded") else raw_body.encode("utf-8")
+            body = parse_multipart_form(body_bytes, content_type)
+        except (binascii.Error, ValueError) as exc:
+            logger.exception("Invalid multipart body received", exc_info=exc)
+            return ResponseBuilder.bad_request(message="Invalid multipart/form-data body")
+    else:
+        try:
+            body = json.loads(event.get("body") or "{}")
+        except json.JSONDecodeError as exc:
+            logger.exception("Invalid JSON body received", exc_info=exc)
+            return ResponseBuilder.bad_request(message="Invalid JSON body")
 
     try:
         request = validate_request(ImageUploadRequest, body)
@@ -85,7 +107,7 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
         )
 
     try:
-        file_data = UploadService.decode_file(request.file)
+        file_data = request.file if isinstance(request.file, bytes) else UploadService.decode_file(request.file)
         service = UploadService()
 
         metadata = service.upload_image(
@@ -9,7 +9,7 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from core.utils.constants import ALLOWED_EXTENSIONS, MAX_FILE_SIZE, USER_ID_PATTERN
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 
 class ImageUploadRequest(BaseModel):
@@ -17,7 +17,10 @@ class ImageUploadRequest(BaseModel):
 
     model_config = ConfigDict(str_strip_whitespace=True)
 
-    file: str = Field(..., description="Base64 encoded image file")
+    file: str | bytes = Field(
+        ...,
+        description="Base64 encoded image file (JSON) or raw image bytes (multipart/form-data)",
+    )
     user_id: str = Field(
         ...,
         min_length=3,
@@ -79,22 +82,25 @@ class ImageUploadRequest(BaseModel):
 
     @field_validator("file")
     @classmethod
-    def validate_file(cls, value: str) -> str:
+    def validate_file(cls, value: str | bytes) -> str | bytes:
         """
-        Validate base64 file:
+        Validate file:
         - must not be empty
-        - must decode correctly
+        - must decode correctly (base64 string only; raw bytes are used as-is)
         - must have non-zero size
         - must not exceed MAX_FILE_SIZE
         """
-        if not value or not value.strip():
+        if not value or (isinstance(value, str) and not value.strip()):
             raise ValueError("file must not be empty")
 
-        try:
-            file_data = base64.b64decode(value, validate=True)
-        except Exception as e:
-            logger.error(f"File validation error: Invalid base64 - {e}")
-            raise ValueError("Invalid base64 encoded file") from e
+        if isinstance(value, bytes):
+            file_data = value
+        else:
+            try:
+                file_data = base64.b64decode(value, validate=True)
+            except Exception as e:
+                logger.error(f"File validation error: Invalid base64 - {e}")
+                raise ValueError("Invalid base64 encoded file") from e
 
         if not file_data:
             logger.error("File validation error: Decoded file is empty")
@@ -5,6 +5,7 @@ for image uploads while translating failures into domain-specific errors.
 """
 
 import base64
+from concurrent.futures import Future, wait
 import hashlib
 from typing import Any
 import uuid
@@ -26,7 +27,7 @@ from core.utils.time import utc_now_iso
 
 Metadata = dict[str, Any]
 
-logger = Logger(UTC=True)
+logger = Logger(utc=True)
 
 
 class UploadService:
@@ -84,10 +85,12 @@ class UploadService:
 
         The upload flow is:
         1. Detect and validate MIME type
-        2. Check for duplicate image content
-        3. Upload image to object storage
-        4. Persist image metadata
-        5. Roll back storage if metadata persistence fails
+        2. Hash the content and reject duplicates already known to the
+           metadata cache, before any storage work
+        3. Build metadata with the deterministic storage key
+        4. Upload image and persist metadata concurrently; the atomic
+           metadata write rejects any remaining duplicates
+        5. Roll back whichever side succeeded if the other failed
 
         Args:
             user_id: Owner of the image
@@ -119,12 +122,10 @@ class UploadService:
                 details={"mime_type": mime_type},
             )
 
-        # Step 2: Detect duplicate image by content hash
+        # Step 2: Hash the content and reject known duplicates before
+        # uploading; unknown ones are caught by the atomic metadata write
         file_hash = hashlib.sha256(file_data).hexdigest()
-        if self.metadata.check_duplicate_image(
-            user_id=user_id,
-            file_hash=file_hash,
-        ):
+        if self.metadata.is_known_duplicate(user_id=user_id, file_hash=file_hash):
             logger.info(
                 "Duplicate image detected",
                 extra={"user_id": user_id},
@@ -134,27 +135,12 @@ class UploadService:
                 details={"user_id": user_id},
             )
 
-        # Step 3: Upload image to storage
+        # Step 3: Build metadata object; the storage key is deterministic,
+        # so it is known before the upload starts
         image_id = self.generate_image_id()
         timestamp = utc_now_iso()
+        s3_key = self.storage.build_key(image_id=image_id, user_id=user_id, mime_type=mime_type)
 
-        try:
-            s3_key = self.storage.upload_image(
-                image_id=image_id,
-                user_id=user_id,
-                file_data=file_data,
-                mime_type=mime_type,
-            )
-        except S3Error:
-            raise
-        except Exception as exc:
-            logger.exception("Image upload to storage failed")
-            raise S3Error(
-                message="Unable to upload image",
-                details={"image_id": image_id},
-            ) from exc
-
-        # Step 4: Build metadata object
         metadata: dict[str, Any] = ImageMetadata(
             image_id=image_id,
             user_id=user_id,
@@ -169,12 +155,43 @@ class UploadService:
             file_hash=file_hash,
         ).model_dump()
 
-        # Step 5: Persist metadata (rollback storage on failure)
-        try:
-            self.metadata.create_metadata(metadata=metadata)
-        except Exception as exc:
-            logger.exception("Failed to persist image metadata")
+        # Step 4: Upload image and persist metadata concurrently, so the
+        # write path costs max(t_s3, t_ddb) rather than their sum
+        upload_future = self.storage.upload_image_async(
+            image_id=image_id,
+            user_id=user_id,
+            file_data=file_data,
+            mime_type=mime_type,
+        )
+        metadata_future = self.metadata.create_metadata_atomic_dedup_async(metadata=metadata)
+        pending: list[Future[Any]] = [upload_future, metadata_future]
+        wait(pending)
+
+        upload_exc = upload_future.exception()
+        metadata_exc = metadata_future.exception()
+
+        # Step 5: Compensate whichever side succeeded if the other failed
+        if upload_exc is not None:
+            logger.error("Image upload to storage failed", exc_info=upload_exc)
+
+            if metadata_exc is None:
+                # Best-effort cleanup to avoid metadata pointing at no object
+                try:
+                    self.metadata.remove_metadata(image_id=image_id, user_id=user_id, file_hash=file_hash)
+                except Exception:
+                    logger.warning(
+                        "Failed to clean up metadata after storage failure",
+                        extra={"image_id": image_id},
+                    )
+
+            if isinstance(upload_exc, S3Error):
+                raise upload_exc
+            raise S3Error(
+                message="Unable to upload image",
+                details={"image_id": image_id},
+            ) from upload_exc
 
+        if metadata_exc is not None:
             # Best-effort cleanup to avoid orphaned storage objects
             try:
                 self.storage.remove_image(key=s3_key)
@@ -184,11 +201,19 @@ class UploadService:
                     extra={"s3_key": s3_key},
                 )
 
+            if isinstance(metadata_exc, DuplicateImageError):
+                logger.info(
+                    "Duplicate image detected",
+                    extra={"user_id": user_id},
+                )
+                raise metadata_exc
+
+            logger.error("Failed to persist image metadata", exc_info=metadata_exc)
             raise MetadataOperationFailedError(
                 message="Unable to save image metadata",
                 error_code=ERROR_CODE_METADATA_CREATE_FAILED,
                 details={"image_id": image_id},
-            ) from exc
+            ) from metadata_exc
 
         logger.info(
             "Image uploaded successfully",
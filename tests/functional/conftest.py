@@ -13,6 +13,24 @@ from moto import mock_aws
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_known_duplicates():
+    """Forget duplicates cached by default repositories between tests."""
+    from core.infrastructure.aws.dynamodb_metadata import _default_known_duplicates
+
+    yield
+    _default_known_duplicates().clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_presigned_urls():
+    """Forget URLs cached by default storages between tests."""
+    from core.infrastructure.aws.s3_image_storage import _default_presigned_urls
+
+    yield
+    _default_presigned_urls().clear()
+
+
 @pytest.fixture(scope="function")
 def aws_mock():
     with mock_aws():
@@ -59,6 +59,39 @@ class TestNameContainsFilter:
         assert len(result) == 1
         assert result[0]["image_name"] == "sunset.jpg"
 
+    def test_filter_does_not_modify_items(self) -> None:
+        items = [
+            {"image_name": "Sunset.jpg"},
+            {"image_name": "landscape.jpg"},
+        ]
+
+        NameContainsFilter.apply(items, "sun")
+
+        assert items == [
+            {"image_name": "Sunset.jpg"},
+            {"image_name": "landscape.jpg"},
+        ]
+
+    def test_filter_uses_stored_lowercased_name(self) -> None:
+        items = [
+            {"image_name": "IMG_001.jpg", "image_name_lower": "sunset.jpg"},
+            {"image_name": "Sunrise.jpg", "image_name_lower": "landscape.jpg"},
+        ]
+
+        result = NameContainsFilter.apply(items, "SUN")
+
+        assert result == [items[0]]
+
+    def test_filter_on_custom_field(self) -> None:
+        items = [
+            {"image_name": "a.jpg", "description": "Beach Sunset"},
+            {"image_name": "b.jpg", "description": "Mountains"},
+        ]
+
+        result = NameContainsFilter.apply(items, "sunset", field_name="description")
+
+        assert result == [items[0]]
+
     def test_validate_returns_true_for_valid_term(self) -> None:
         assert NameContainsFilter.validate("sun") is True
 
@@ -2,11 +2,12 @@
 Unit tests for DynamoDBAdapter.
 """
 
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 import pytest
 
 from core.infrastructure.adapters.dynamodb_adapter import DynamoDBAdapter
-from core.utils.constants import ENV_IMAGE_METADATA_TABLE_NAME
+from core.utils.constants import ENV_AWS_ENDPOINT_URL_DYNAMODB, ENV_IMAGE_METADATA_TABLE_NAME
 
 
 class TestDynamoDBAdapter:
@@ -17,6 +18,20 @@ class TestDynamoDBAdapter:
         with pytest.raises(RuntimeError):
             DynamoDBAdapter()
 
+    def test_adapters_share_resource(self, dynamodb_table) -> None:
+        first = DynamoDBAdapter()
+        second = DynamoDBAdapter()
+
+        assert first._table.meta.client is second._table.meta.client
+
+    def test_service_endpoint_overrides_global_endpoint(self, monkeypatch) -> None:
+        monkeypatch.setenv("AWS_ENDPOINT_URL", "http://global:4566")
+        monkeypatch.setenv(ENV_AWS_ENDPOINT_URL_DYNAMODB, "http://dynamodb:8000")
+
+        adapter = DynamoDBAdapter()
+
+        assert adapter._table.meta.client.meta.endpoint_url == "http://dynamodb:8000"
+
     def test_put_and_get_item_success(self, dynamodb_table) -> None:
         adapter = DynamoDBAdapter()
 
@@ -60,6 +75,20 @@ class TestDynamoDBAdapter:
         response = adapter.get_item(key={"image_id": "img_del"})
         assert "Item" not in response
 
+    def test_writes_request_minimal_response(self, monkeypatch, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+        calls: list[dict] = []
+
+        monkeypatch.setattr(adapter._table, "put_item", lambda **kwargs: calls.append(kwargs) or {})
+        monkeypatch.setattr(adapter._table, "delete_item", lambda **kwargs: calls.append(kwargs) or {})
+
+        adapter.put_item(item={"image_id": "img_1"})
+        adapter.delete_item(key={"image_id": "img_1"})
+
+        for call in calls:
+            assert call["ReturnValues"] == "NONE"
+            assert call["ReturnConsumedCapacity"] == "NONE"
+
     def test_query_returns_items(self, dynamodb_table) -> None:
         adapter = DynamoDBAdapter()
 
@@ -86,6 +115,129 @@ class TestDynamoDBAdapter:
 
         assert len(response["Items"]) == 2
 
+    def test_paginate_query_returns_last_evaluated_key(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        for i in range(3):
+            adapter.put_item(
+                item={
+                    "image_id": f"img_{i}",
+                    "user_id": "john",
+                    "created_at": f"2024-01-0{i + 1}T10:00:00Z",
+                }
+            )
+
+        first_page, last_key = adapter.paginate_query(
+            key_condition=Key("user_id").eq("john"),
+            limit=2,
+            IndexName="user-created-index",
+        )
+        second_page, final_key = adapter.paginate_query(
+            key_condition=Key("user_id").eq("john"),
+            limit=2,
+            exclusive_start_key=last_key,
+            IndexName="user-created-index",
+        )
+
+        assert [item["image_id"] for item in first_page] == ["img_0", "img_1"]
+        assert last_key is not None
+        assert [item["image_id"] for item in second_page] == ["img_2"]
+        assert final_key is None
+
+    def test_transact_put_is_all_or_nothing(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+        adapter.put_item(item={"image_id": "marker"})
+
+        with pytest.raises(ClientError) as exc:
+            adapter.transact_put(
+                items=[{"image_id": "img_new"}, {"image_id": "marker"}],
+                condition_expression="attribute_not_exists(image_id)",
+            )
+
+        assert exc.value.response["Error"]["Code"] == "TransactionCanceledException"
+        assert "Item" not in adapter.get_item(key={"image_id": "img_new"})
+
+    def test_batch_put_inserts_all_items(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        items = [{"image_id": f"img_{i}", "user_id": "john"} for i in range(30)]
+
+        adapter.batch_put(items=items)
+
+        for item in items:
+            response = adapter.get_item(key={"image_id": item["image_id"]})
+            assert response["Item"] == item
+
+    def test_batch_put_keeps_last_duplicate(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        adapter.batch_put(
+            items=[
+                {"image_id": "img_dup", "user_id": "john"},
+                {"image_id": "img_dup", "user_id": "alice"},
+            ]
+        )
+
+        response = adapter.get_item(key={"image_id": "img_dup"})
+        assert response["Item"]["user_id"] == "alice"
+
+    def test_batch_delete_removes_all_items(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        keys = [{"image_id": f"img_{i}"} for i in range(30)]
+        adapter.batch_put(items=[{**key, "user_id": "john"} for key in keys])
+
+        adapter.batch_delete(keys=keys)
+
+        for key in keys:
+            assert "Item" not in adapter.get_item(key=key)
+
+    def test_batch_get_returns_existing_items(self, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        adapter.batch_put(items=[{"image_id": f"img_{i}", "user_id": "john"} for i in range(3)])
+
+        items = adapter.batch_get(keys=[{"image_id": "img_0"}, {"image_id": "img_2"}, {"image_id": "img_missing"}])
+
+        assert sorted(item["image_id"] for item in items) == ["img_0", "img_2"]
+
+    def test_batch_get_retries_unprocessed_keys(self, monkeypatch, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+        table_name = adapter._table.name
+        responses = [
+            {
+                "Responses": {table_name: [{"image_id": "img_0"}]},
+                "UnprocessedKeys": {table_name: {"Keys": [{"image_id": "img_1"}]}},
+            },
+            {"Responses": {table_name: [{"image_id": "img_1"}]}, "UnprocessedKeys": {}},
+        ]
+        requests: list[dict] = []
+
+        def fake_batch_get_item(**kwargs):
+            requests.append(kwargs["RequestItems"])
+            return responses.pop(0)
+
+        monkeypatch.setattr(adapter._table.meta.client, "batch_get_item", fake_batch_get_item)
+        monkeypatch.setattr("core.infrastructure.adapters.dynamodb_adapter.time.sleep", lambda _: None)
+
+        items = adapter.batch_get(keys=[{"image_id": "img_0"}, {"image_id": "img_1"}])
+
+        assert [item["image_id"] for item in items] == ["img_0", "img_1"]
+        assert requests[1] == {table_name: {"Keys": [{"image_id": "img_1"}]}}
+
+    def test_batch_get_raises_when_keys_stay_unprocessed(self, monkeypatch, dynamodb_table) -> None:
+        adapter = DynamoDBAdapter()
+
+        monkeypatch.setattr(
+            adapter._table.meta.client,
+            "batch_get_item",
+            lambda **kwargs: {"Responses": {}, "UnprocessedKeys": kwargs["RequestItems"]},
+        )
+        monkeypatch.setattr("core.infrastructure.adapters.dynamodb_adapter.time.sleep", lambda _: None)
+
+        with pytest.raises(RuntimeError):
+            adapter.batch_get(keys=[{"image_id": "img_0"}])
+
     def test_get_item_bubbles_client_error(self, monkeypatch, dynamodb_table) -> None:
         adapter = DynamoDBAdapter()
 
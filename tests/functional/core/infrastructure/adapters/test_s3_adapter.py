@@ -1,8 +1,10 @@
+import os
+
 from botocore.exceptions import ClientError
 import pytest
 
 from core.infrastructure.adapters.s3_adapter import S3Adapter
-from core.utils.constants import ENV_IMAGE_S3_BUCKET_NAME
+from core.utils.constants import ENV_AWS_ENDPOINT_URL_S3, ENV_IMAGE_S3_BUCKET_NAME
 
 
 class TestS3Adapter:
@@ -12,6 +14,15 @@ class TestS3Adapter:
         with pytest.raises(RuntimeError):
             S3Adapter()
 
+    def test_adapters_share_client(self, s3_bucket):
+        assert S3Adapter()._client is S3Adapter()._client
+
+    def test_service_endpoint_overrides_global_endpoint(self, monkeypatch):
+        monkeypatch.setenv("AWS_ENDPOINT_URL", "http://global:4566")
+        monkeypatch.setenv(ENV_AWS_ENDPOINT_URL_S3, "http://s3:9000")
+
+        assert S3Adapter()._client.meta.endpoint_url == "http://s3:9000"
+
     def test_put_and_get_object_success(
         self,
         s3_bucket,
@@ -33,6 +44,21 @@ class TestS3Adapter:
 
         assert content == data
 
+    def test_get_object_byte_range(self, s3_bucket):
+        adapter = S3Adapter()
+
+        key = "images/user/img_range.png"
+        adapter.put_object(
+            key=key,
+            body=b"0123456789",
+            content_type="image/png",
+            metadata={},
+        )
+
+        response = adapter.get_object(key=key, byte_range="bytes=0-3")
+
+        assert response["Body"].read() == b"0123"
+
     def test_get_object_missing_key_raises_client_error(
         self,
         s3_bucket,
@@ -62,6 +88,54 @@ class TestS3Adapter:
 
         assert exc.value.response["Error"]["Code"] == "NoSuchKey"
 
+    def test_delete_objects_success(
+        self,
+        s3_bucket,
+        s3_put_object,
+        s3_get_object,
+    ):
+        adapter = S3Adapter()
+
+        keys = [f"images/user/img_{i}.jpg" for i in range(3)]
+        for key in keys:
+            s3_put_object(key, b"data", "image/jpeg")
+
+        responses = adapter.delete_objects(keys=keys)
+
+        assert len(responses) == 1
+        assert not responses[0].get("Errors")
+        for key in keys:
+            with pytest.raises(ClientError):
+                s3_get_object(key)
+
+    def test_delete_objects_batches_by_1000(self, monkeypatch, s3_bucket):
+        adapter = S3Adapter()
+        batch_sizes: list[int] = []
+
+        def fake_delete_objects(**kwargs):
+            batch_sizes.append(len(kwargs["Delete"]["Objects"]))
+            return {}
+
+        monkeypatch.setattr(adapter._client, "delete_objects", fake_delete_objects)
+
+        adapter.delete_objects(keys=[f"k{i}" for i in range(2500)])
+
+        assert batch_sizes == [1000, 1000, 500]
+
+    def test_generate_presigned_url_includes_bucket(self, s3_bucket):
+        adapter = S3Adapter()
+        params = {"Key": "images/user/img_1.jpg"}
+
+        url = adapter.generate_presigned_url(
+            method="get_object",
+            params=params,
+            expires_in=60,
+        )
+
+        assert os.environ[ENV_IMAGE_S3_BUCKET_NAME] in url
+        assert "images/user/img_1.jpg" in url
+        assert params == {"Key": "images/user/img_1.jpg"}
+
     def test_put_object_bubbles_client_error(self, monkeypatch, s3_bucket):
         adapter = S3Adapter()
 
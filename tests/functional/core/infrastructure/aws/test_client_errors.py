@@ -0,0 +1,15 @@
+from botocore.exceptions import ClientError
+
+from core.infrastructure.aws.client_errors import client_error_code
+
+
+class TestClientErrorCode:
+    def test_returns_error_code(self) -> None:
+        exc = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+        assert client_error_code(exc) == "NoSuchKey"
+
+    def test_missing_error_returns_empty_string(self) -> None:
+        exc = ClientError({}, "GetObject")
+
+        assert client_error_code(exc) == ""
@@ -14,6 +14,7 @@ from core.models.errors import (
     DynamoDBError,
     FilterError,
 )
+from core.utils.constants import IMAGE_NAME_LOWER_ATTRIBUTE, LIST_IMAGE_ATTRIBUTES
 
 
 class DummyAdapter:
@@ -23,12 +24,24 @@ class DummyAdapter:
     get_item: Callable[..., dict[str, Any]]
     delete_item: Callable[..., Any]
     query: Callable[..., dict[str, Any]]
+    scan: Callable[..., dict[str, Any]]
+    paginate_query: Callable[..., tuple[list[dict[str, Any]], dict[str, Any] | None]]
+    batch_get: Callable[..., list[dict[str, Any]]]
+    transact_put: Callable[..., None]
+    batch_delete: Callable[..., None]
+    transact_delete: Callable[..., None]
 
     def __init__(self) -> None:
         self.put_item = lambda **_: None
         self.get_item = lambda **_: {}
         self.delete_item = lambda **_: None
         self.query = lambda **_: {"Items": []}
+        self.scan = lambda **_: {"Items": []}
+        self.paginate_query = lambda **_: ([], None)
+        self.batch_get = lambda **_: []
+        self.transact_put = lambda **_: None
+        self.batch_delete = lambda **_: None
+        self.transact_delete = lambda **_: None
 
 
 VALID_METADATA = {
@@ -38,7 +51,16 @@ VALID_METADATA = {
 }
 
 
+@pytest.fixture
+def legacy_duplicate_check(monkeypatch) -> None:
+    """Enable the check for images stored without a dedup marker."""
+    monkeypatch.setattr("core.infrastructure.aws.dynamodb_metadata.LEGACY_DUPLICATE_CHECK", True)
+
+
 class TestDynamoDBMetadata:
+    def test_default_repositories_share_adapter(self, dynamodb_table) -> None:
+        assert DynamoDBMetadata()._db is DynamoDBMetadata()._db
+
     # ------------------------------------------------------------------
     # create_metadata
     # ------------------------------------------------------------------
@@ -47,6 +69,25 @@ class TestDynamoDBMetadata:
         repo = DynamoDBMetadata(DummyAdapter())
         repo.create_metadata(metadata=VALID_METADATA)
 
+    def test_create_metadata_stores_lowercased_image_name(self) -> None:
+        captured: dict[str, Any] = {}
+        adapter = DummyAdapter()
+        adapter.put_item = lambda **kwargs: captured.update(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        repo.create_metadata(metadata={**VALID_METADATA, "image_name": "Sunset.JPG"})
+
+        assert captured["item"]["image_name"] == "Sunset.JPG"
+        assert captured["item"][IMAGE_NAME_LOWER_ATTRIBUTE] == "sunset.jpg"
+
+    def test_create_metadata_async_propagates_errors(self) -> None:
+        repo = DynamoDBMetadata(DummyAdapter())
+
+        assert repo.create_metadata_async(metadata=VALID_METADATA).result() is None
+
+        with pytest.raises(ValueError):
+            repo.create_metadata_async(metadata={"image_id": "img_1"}).result()
+
     def test_create_metadata_missing_required_fields(self) -> None:
         repo = DynamoDBMetadata(DummyAdapter())
 
@@ -162,6 +203,264 @@ class TestDynamoDBMetadata:
         with pytest.raises(DynamoDBError):
             repo.remove_metadata(image_id="img_1")
 
+    # ------------------------------------------------------------------
+    # create_metadata_atomic_dedup
+    # ------------------------------------------------------------------
+
+    def test_create_metadata_atomic_dedup_writes_item_and_marker(self) -> None:
+        captured: dict[str, Any] = {}
+        adapter = DummyAdapter()
+        adapter.transact_put = lambda **kwargs: captured.update(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        repo.create_metadata_atomic_dedup(metadata={**VALID_METADATA, "image_name": "Sunset.JPG"})
+
+        item, marker = captured["items"]
+        assert item[IMAGE_NAME_LOWER_ATTRIBUTE] == "sunset.jpg"
+        assert marker == {"image_id": "dedup#u1#hash123", "dedup_image_id": "img_1"}
+        assert captured["condition_expression"] == "attribute_not_exists(image_id)"
+
+    def test_create_metadata_atomic_dedup_conflict_raises_duplicate(self) -> None:
+        def raise_cancelled(**_: Any) -> None:
+            raise ClientError(
+                {
+                    "Error": {"Code": "TransactionCanceledException"},
+                    "CancellationReasons": [{"Code": "None"}, {"Code": "ConditionalCheckFailed"}],
+                },
+                "TransactWriteItems",
+            )
+
+        adapter = DummyAdapter()
+        adapter.transact_put = raise_cancelled
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DuplicateImageError):
+            repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+    def test_create_metadata_atomic_dedup_client_error(self) -> None:
+        def raise_client_error(**_: Any) -> None:
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "TransactWriteItems")
+
+        adapter = DummyAdapter()
+        adapter.transact_put = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+    def test_create_metadata_atomic_dedup_skips_legacy_check_by_default(self) -> None:
+        adapter = DummyAdapter()
+        adapter.query = lambda **_: pytest.fail("legacy check is off")
+        repo = DynamoDBMetadata(adapter)
+
+        repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+    def test_create_metadata_atomic_dedup_rolls_back_unmarked_duplicate(self, legacy_duplicate_check) -> None:
+        deleted: dict[str, Any] = {}
+        adapter = DummyAdapter()
+        adapter.query = lambda **_: {"Items": [{"image_id": "img_legacy"}]}
+        adapter.get_item = lambda **_: {"Item": {"image_id": "img_legacy", "file_hash": "hash123"}}
+        adapter.transact_delete = lambda **kwargs: deleted.update(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DuplicateImageError):
+            repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+        assert [delete.key for delete in deleted["deletes"]] == [
+            {"image_id": "img_1"},
+            {"image_id": "dedup#u1#hash123"},
+        ]
+        assert repo.is_known_duplicate(user_id="u1", file_hash="hash123")
+
+    def test_create_metadata_atomic_dedup_ignores_its_own_item(self, legacy_duplicate_check) -> None:
+        adapter = DummyAdapter()
+        adapter.query = lambda **_: {"Items": [{"image_id": "img_1"}]}
+        adapter.get_item = lambda **_: {"Item": VALID_METADATA}
+        adapter.transact_delete = lambda **_: pytest.fail("write should not be rolled back")
+        repo = DynamoDBMetadata(adapter)
+
+        repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+        assert repo.is_known_duplicate(user_id="u1", file_hash="hash123")
+
+    def test_create_metadata_atomic_dedup_failed_check_rolls_back(self, legacy_duplicate_check) -> None:
+        deleted: dict[str, Any] = {}
+        adapter = DummyAdapter()
+        adapter.query = lambda **_: (_ for _ in ()).throw(Exception("boom"))
+        adapter.transact_delete = lambda **kwargs: deleted.update(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+        assert [delete.key for delete in deleted["deletes"]] == [
+            {"image_id": "img_1"},
+            {"image_id": "dedup#u1#hash123"},
+        ]
+        assert not repo.is_known_duplicate(user_id="u1", file_hash="hash123")
+
+    def test_remove_metadata_with_hash_removes_marker(self) -> None:
+        captured: dict[str, Any] = {}
+        adapter = DummyAdapter()
+        adapter.transact_delete = lambda **kwargs: captured.update(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        repo.remove_metadata(image_id="img_1", user_id="u1", file_hash="hash123")
+
+        item_delete, marker_delete = captured["deletes"]
+        assert item_delete.key == {"image_id": "img_1"}
+        assert item_delete.condition_expression is None
+        assert marker_delete.key == {"image_id": "dedup#u1#hash123"}
+        assert marker_delete.expression_values == {":image_id": "img_1"}
+
+    def test_remove_metadata_keeps_marker_claimed_by_other_image(self, dynamodb_table, dynamodb_put_item) -> None:
+        dynamodb_put_item({"image_id": "img_1", "user_id": "u1", "file_hash": "hash123"})
+        dynamodb_put_item({"image_id": "dedup#u1#hash123", "dedup_image_id": "img_other"})
+
+        DynamoDBMetadata().remove_metadata(image_id="img_1", user_id="u1", file_hash="hash123")
+
+        assert dynamodb_table.get_item(Key={"image_id": "img_1"}).get("Item") is None
+        assert dynamodb_table.get_item(Key={"image_id": "dedup#u1#hash123"}).get("Item") is not None
+
+    def test_remove_metadata_releases_own_marker(self, dynamodb_table) -> None:
+        repo = DynamoDBMetadata()
+        repo.create_metadata_atomic_dedup(metadata=VALID_METADATA)
+
+        repo.remove_metadata(image_id="img_1", user_id="u1", file_hash="hash123")
+
+        assert dynamodb_table.scan()["Items"] == []
+
+    # ------------------------------------------------------------------
+    # backfill_dedup_markers
+    # ------------------------------------------------------------------
+
+    def test_backfill_dedup_markers_marks_unmarked_images(self, dynamodb_table, dynamodb_put_item) -> None:
+        dynamodb_put_item({"image_id": "img_old", "user_id": "u1", "file_hash": "h1"})
+        repo = DynamoDBMetadata()
+        repo.create_metadata_atomic_dedup(metadata={"image_id": "img_new", "user_id": "u1", "file_hash": "h2"})
+
+        assert repo.backfill_dedup_markers() == 1
+        assert repo.backfill_dedup_markers() == 0
+
+        marker = dynamodb_table.get_item(Key={"image_id": "dedup#u1#h1"})["Item"]
+        assert marker["dedup_image_id"] == "img_old"
+
+        with pytest.raises(DuplicateImageError):
+            repo.create_metadata_atomic_dedup(metadata={"image_id": "img_again", "user_id": "u1", "file_hash": "h1"})
+
+    def test_backfill_dedup_markers_client_error(self) -> None:
+        def raise_client_error(**_: Any) -> dict[str, Any]:
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "Scan")
+
+        adapter = DummyAdapter()
+        adapter.scan = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.backfill_dedup_markers()
+
+    def test_fetch_metadata_hides_dedup_markers(self) -> None:
+        adapter = DummyAdapter()
+        adapter.get_item = lambda **_: pytest.fail("markers are never read as images")
+        adapter.batch_get = lambda **_: pytest.fail("markers are never read as images")
+        repo = DynamoDBMetadata(adapter)
+
+        assert repo.fetch_metadata(image_id="dedup#u1#hash123") is None
+        assert repo.fetch_metadata_bulk(image_ids=["dedup#u1#hash123"]) == {}
+
+    # ------------------------------------------------------------------
+    # fetch_metadata_bulk
+    # ------------------------------------------------------------------
+
+    def test_fetch_metadata_bulk_chunks_and_merges(self) -> None:
+        calls: list[list[dict[str, Any]]] = []
+
+        def batch_get(*, keys: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            calls.append(keys)
+            return [{**key, "user_id": "u1"} for key in keys if key["image_id"] != "img_missing"]
+
+        adapter = DummyAdapter()
+        adapter.batch_get = batch_get
+        repo = DynamoDBMetadata(adapter)
+
+        image_ids = [f"img_{i}" for i in range(150)] + ["img_0", "img_missing"]
+        result = repo.fetch_metadata_bulk(image_ids=image_ids)
+
+        assert sorted(len(keys) for keys in calls) == [51, 100]
+        assert len(result) == 150
+        assert result["img_42"] == {"image_id": "img_42", "user_id": "u1"}
+        assert "img_missing" not in result
+
+    def test_fetch_metadata_bulk_empty(self) -> None:
+        repo = DynamoDBMetadata(DummyAdapter())
+
+        assert repo.fetch_metadata_bulk(image_ids=[]) == {}
+
+    def test_fetch_metadata_bulk_client_error(self) -> None:
+        def raise_client_error(**_: Any) -> list[dict[str, Any]]:
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+                "BatchGetItem",
+            )
+
+        adapter = DummyAdapter()
+        adapter.batch_get = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.fetch_metadata_bulk(image_ids=["img_1"])
+
+    # ------------------------------------------------------------------
+    # remove_metadata_bulk
+    # ------------------------------------------------------------------
+
+    def test_remove_metadata_bulk_success(self) -> None:
+        captured: dict[str, Any] = {}
+        released: list[dict[str, Any]] = []
+        adapter = DummyAdapter()
+        adapter.batch_delete = lambda **kwargs: captured.update(kwargs)
+        adapter.delete_item = lambda **kwargs: released.append(kwargs)
+        repo = DynamoDBMetadata(adapter)
+
+        repo.remove_metadata_bulk(entries=[("img_1", "u1", "h1"), ("img_2", "u1", "h2")])
+
+        assert captured["keys"] == [{"image_id": "img_1"}, {"image_id": "img_2"}]
+        assert sorted(call["key"]["image_id"] for call in released) == ["dedup#u1#h1", "dedup#u1#h2"]
+        assert all(call["condition_expression"] is not None for call in released)
+
+    def test_remove_metadata_bulk_keeps_marker_claimed_by_other_image(self, dynamodb_table, dynamodb_put_item) -> None:
+        dynamodb_put_item({"image_id": "img_1", "user_id": "u1", "file_hash": "hash123"})
+        dynamodb_put_item({"image_id": "dedup#u1#hash123", "dedup_image_id": "img_other"})
+
+        DynamoDBMetadata().remove_metadata_bulk(entries=[("img_1", "u1", "hash123")])
+
+        assert dynamodb_table.get_item(Key={"image_id": "img_1"}).get("Item") is None
+        assert dynamodb_table.get_item(Key={"image_id": "dedup#u1#hash123"}).get("Item") is not None
+
+    def test_content_can_be_reuploaded_after_bulk_remove(self, dynamodb_table) -> None:
+        repo = DynamoDBMetadata()
+        metadata = {**VALID_METADATA, "created_at": "2024-01-01T10:00:00Z"}
+        repo.create_metadata_atomic_dedup(metadata=metadata)
+
+        repo.remove_metadata_bulk(entries=[("img_1", "u1", "hash123")])
+
+        repo.create_metadata_atomic_dedup(metadata={**metadata, "image_id": "img_2"})
+        assert dynamodb_table.get_item(Key={"image_id": "img_2"}).get("Item") is not None
+
+    def test_remove_metadata_bulk_client_error(self) -> None:
+        def raise_client_error(**_: Any) -> None:
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException"}},
+                "BatchWriteItem",
+            )
+
+        adapter = DummyAdapter()
+        adapter.batch_delete = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.remove_metadata_bulk(entries=[("img_1", "u1", "hash123")])
+
     # ------------------------------------------------------------------
     # list_user_images
     # ------------------------------------------------------------------
@@ -196,6 +495,175 @@ class TestDynamoDBMetadata:
         result = repo.list_user_images(user_id="u1", limit=10)
         assert len(result) == 2
 
+    def test_list_user_images_requests_only_remaining_items(self) -> None:
+        limits: list[int] = []
+        pages = [
+            {"Items": [{"image_id": "img_1"}], "LastEvaluatedKey": {"image_id": "img_1"}},
+            {"Items": [{"image_id": "img_2"}, {"image_id": "img_3"}], "LastEvaluatedKey": {"image_id": "img_3"}},
+        ]
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            limits.append(kwargs["Limit"])
+            return pages[len(limits) - 1]
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        result = repo.list_user_images(user_id="u1", limit=3)
+
+        assert [item["image_id"] for item in result] == ["img_1", "img_2", "img_3"]
+        assert limits == [3, 2]
+
+    def test_iter_user_images_stops_querying_when_caller_stops(self) -> None:
+        calls: list[dict[str, Any]] = []
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            calls.append(dict(kwargs))
+            return {
+                "Items": [{"image_id": f"img_{len(calls)}"}],
+                "LastEvaluatedKey": {"image_id": f"img_{len(calls)}"},
+            }
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        images = repo.iter_user_images(user_id="u1", limit=10)
+        assert calls == []
+
+        assert next(images) == {"image_id": "img_1"}
+        assert len(calls) == 1
+
+    def test_iter_user_images_validates_eagerly(self) -> None:
+        repo = DynamoDBMetadata(DummyAdapter())
+
+        with pytest.raises(FilterError):
+            repo.iter_user_images(user_id="u1", limit=0)
+
+    def test_iter_user_images_translates_errors_during_iteration(self) -> None:
+        def raise_client_error(**_: Any) -> dict[str, Any]:
+            raise ClientError({"Error": {"Code": "InternalServerError"}}, "Query")
+
+        adapter = DummyAdapter()
+        adapter.query = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        images = repo.iter_user_images(user_id="u1", limit=10)
+
+        with pytest.raises(DynamoDBError):
+            next(images)
+
+    def test_list_user_images_name_contains_sets_filter_expression(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10, name_contains="SunSet")
+
+        expression = captured["FilterExpression"]
+        contains, not_exists = expression.get_expression()["values"]
+        assert contains.get_expression()["values"][1] == "sunset"
+        assert not_exists.expression_operator == "attribute_not_exists"
+
+    def test_list_user_images_without_name_contains_has_no_filter(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10, name_contains="   ")
+
+        assert "FilterExpression" not in captured
+
+    @pytest.mark.parametrize(
+        ("start_date", "end_date", "operator"),
+        [
+            ("2024-01-01", "2024-01-31", "BETWEEN"),
+            ("2024-01-01", None, ">="),
+            (None, "2024-01-31", "<="),
+        ],
+    )
+    def test_list_user_images_date_key_condition(
+        self,
+        start_date: str | None,
+        end_date: str | None,
+        operator: str,
+    ) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10, start_date=start_date, end_date=end_date)
+
+        _, date_condition = captured["KeyConditionExpression"].get_expression()["values"]
+        assert date_condition.expression_operator == operator
+
+    def test_list_user_images_without_dates_uses_user_key_only(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10)
+
+        assert captured["KeyConditionExpression"].expression_operator == "="
+
+    def test_list_user_images_projects_list_attributes_by_default(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10)
+
+        names = captured["ExpressionAttributeNames"]
+        projected = [names[placeholder] for placeholder in captured["ProjectionExpression"].split(", ")]
+        assert projected == list(LIST_IMAGE_ATTRIBUTES)
+
+    def test_list_user_images_projects_requested_attributes(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.list_user_images(user_id="u1", limit=10, attributes=["image_id", "name"])
+
+        assert captured["ProjectionExpression"] == "#p0, #p1"
+        assert captured["ExpressionAttributeNames"] == {"#p0": "image_id", "#p1": "name"}
+
     def test_list_user_images_client_error(self) -> None:
         def raise_client_error(**_: Any) -> dict[str, Any]:
             raise ClientError(
@@ -218,6 +686,69 @@ class TestDynamoDBMetadata:
         with pytest.raises(DynamoDBError):
             repo.list_user_images(user_id="u1", limit=10)
 
+    # ------------------------------------------------------------------
+    # list_user_images_page
+    # ------------------------------------------------------------------
+
+    def test_list_user_images_page_returns_last_key(self) -> None:
+        adapter = DummyAdapter()
+        adapter.paginate_query = lambda **_: ([{"image_id": "img_1"}], {"image_id": "img_1"})
+        repo = DynamoDBMetadata(adapter)
+
+        items, last_key = repo.list_user_images_page(user_id="u1", limit=1)
+
+        assert items == [{"image_id": "img_1"}]
+        assert last_key == {"image_id": "img_1"}
+
+    def test_list_user_images_page_fills_short_filtered_pages(self) -> None:
+        calls: list[dict[str, Any]] = []
+        pages = [
+            ([{"image_id": "img_1"}], {"image_id": "img_1"}),
+            ([{"image_id": "img_2"}], None),
+        ]
+
+        def paginate_query(**kwargs: Any) -> tuple[list[dict[str, Any]], dict[str, Any] | None]:
+            calls.append(kwargs)
+            return pages[len(calls) - 1]
+
+        adapter = DummyAdapter()
+        adapter.paginate_query = paginate_query
+        repo = DynamoDBMetadata(adapter)
+
+        items, last_key = repo.list_user_images_page(
+            user_id="u1",
+            limit=3,
+            name_contains="img",
+            exclusive_start_key={"image_id": "img_0"},
+        )
+
+        assert [item["image_id"] for item in items] == ["img_1", "img_2"]
+        assert last_key is None
+        assert [call["limit"] for call in calls] == [3, 2]
+        assert calls[0]["exclusive_start_key"] == {"image_id": "img_0"}
+        assert calls[1]["exclusive_start_key"] == {"image_id": "img_1"}
+        assert "FilterExpression" in calls[0]
+
+    def test_list_user_images_page_invalid_limit(self) -> None:
+        repo = DynamoDBMetadata(DummyAdapter())
+
+        with pytest.raises(FilterError):
+            repo.list_user_images_page(user_id="u1", limit=0)
+
+    def test_list_user_images_page_client_error(self) -> None:
+        def raise_client_error(**_: Any) -> tuple[list[dict[str, Any]], None]:
+            raise ClientError(
+                {"Error": {"Code": "ValidationException"}},
+                "Query",
+            )
+
+        adapter = DummyAdapter()
+        adapter.paginate_query = raise_client_error
+        repo = DynamoDBMetadata(adapter)
+
+        with pytest.raises(DynamoDBError):
+            repo.list_user_images_page(user_id="u1", limit=10)
+
     # ------------------------------------------------------------------
     # check_duplicate_image
     # ------------------------------------------------------------------
@@ -229,6 +760,110 @@ class TestDynamoDBMetadata:
 
         assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is True
 
+    def test_check_duplicate_image_projects_key_only(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.check_duplicate_image(user_id="u1", file_hash="abc")
+
+        assert captured["ProjectionExpression"] == "image_id"
+
+    def test_check_duplicate_image_caches_positive_result(self) -> None:
+        calls: list[dict[str, Any]] = []
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs)
+            return {"Items": [{"image_id": "img_1"}]}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        adapter.get_item = lambda **_: {"Item": {"image_id": "img_1", "file_hash": "abc"}}
+        repo = DynamoDBMetadata(adapter)
+
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is True
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is True
+        assert len(calls) == 1
+
+    def test_check_duplicate_image_requeries_when_cached_image_is_gone(self) -> None:
+        calls: list[dict[str, Any]] = []
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs)
+            return {"Items": [{"image_id": "img_1"}]} if len(calls) == 1 else {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is True
+        # Deleted by another instance: the read-back misses
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is False
+        assert len(calls) == 2
+        assert not repo.is_known_duplicate(user_id="u1", file_hash="abc")
+
+    def test_is_known_duplicate_confirms_cached_image(self) -> None:
+        adapter = DummyAdapter()
+        adapter.get_item = lambda **_: {"Item": {"image_id": "img_1", "file_hash": "abc"}}
+        adapter.query = lambda **_: pytest.fail("cache hits are confirmed by key")
+        repo = DynamoDBMetadata(adapter)
+
+        assert not repo.is_known_duplicate(user_id="u1", file_hash="abc")
+
+        repo.create_metadata(metadata={"image_id": "img_1", "user_id": "u1", "file_hash": "abc"})
+        assert repo.is_known_duplicate(user_id="u1", file_hash="abc")
+
+        adapter.get_item = lambda **_: {}
+        assert not repo.is_known_duplicate(user_id="u1", file_hash="abc")
+
+    def test_check_duplicate_image_does_not_cache_negative_result(self) -> None:
+        calls: list[dict[str, Any]] = []
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            calls.append(kwargs)
+            return {"Items": []}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        repo.check_duplicate_image(user_id="u1", file_hash="abc")
+        repo.check_duplicate_image(user_id="u1", file_hash="abc")
+
+        assert len(calls) == 2
+
+    def test_created_image_is_known_duplicate_until_removed(self) -> None:
+        adapter = DummyAdapter()
+        adapter.query = lambda **_: {"Items": []}
+        adapter.get_item = lambda **_: {"Item": {"image_id": "img_1", "file_hash": "abc"}}
+        repo = DynamoDBMetadata(adapter)
+
+        repo.create_metadata(metadata={"image_id": "img_1", "user_id": "u1", "file_hash": "abc"})
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is True
+
+        repo.remove_metadata(image_id="img_1")
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is False
+
+    def test_check_duplicate_image_excludes_given_image(self) -> None:
+        captured: dict[str, Any] = {}
+
+        def query(**kwargs: Any) -> dict[str, Any]:
+            captured.update(kwargs)
+            return {"Items": [{"image_id": "img_new"}]}
+
+        adapter = DummyAdapter()
+        adapter.query = query
+        repo = DynamoDBMetadata(adapter)
+
+        assert repo.check_duplicate_image(user_id="u1", file_hash="abc", exclude_image_id="img_new") is False
+        assert captured["Limit"] == 2
+
     def test_check_duplicate_image_false(self) -> None:
         repo = DynamoDBMetadata(DummyAdapter())
         assert repo.check_duplicate_image(user_id="u1", file_hash="abc") is False
@@ -17,10 +17,14 @@ class DummyBody:
 
     def __init__(self, data: bytes) -> None:
         self._data = data
+        self.closed = False
 
     def read(self) -> bytes:
         return self._data
 
+    def close(self) -> None:
+        self.closed = True
+
 
 class DummyS3Adapter:
     """Configurable S3 adapter test double (mypy-safe)."""
@@ -39,6 +43,7 @@ class DummyS3Adapter:
         self._delete_exc = delete_exc
         self._get_response = get_response or {}
         self._presigned_url = presigned_url
+        self.presign_calls = 0
 
     def put_object(self, **_: Any) -> None:
         if self._put_exc:
@@ -53,6 +58,11 @@ class DummyS3Adapter:
         if self._delete_exc:
             raise self._delete_exc
 
+    def delete_objects(self, *, keys: list[str]) -> list[dict[str, Any]]:
+        if self._delete_exc:
+            raise self._delete_exc
+        return [{"Errors": [{"Key": key, "Code": "AccessDenied"} for key in keys if key.endswith(".locked")]}]
+
     def generate_presigned_url(
         self,
         *,
@@ -60,10 +70,52 @@ class DummyS3Adapter:
         params: dict[str, Any],
         expires_in: int,
     ) -> str:
+        self.presign_calls += 1
         return self._presigned_url
 
 
 class TestS3ImageStorage:
+    def test_presigned_url_is_reused_within_half_expiry(self, monkeypatch) -> None:
+        adapter = DummyS3Adapter()
+        storage = S3ImageStorage(adapter)
+        monkeypatch.setattr("core.infrastructure.aws.s3_image_storage.time.time", lambda: 1000.0)
+
+        first = storage.generate_presigned_get_url(key="images/u/img.png", expires_in=300)
+        second = storage.generate_presigned_get_url(key="images/u/img.png", expires_in=300)
+
+        assert first == second
+        assert adapter.presign_calls == 1
+
+        monkeypatch.setattr("core.infrastructure.aws.s3_image_storage.time.time", lambda: 1000.0 + 150)
+        storage.generate_presigned_get_url(key="images/u/img.png", expires_in=300)
+
+        assert adapter.presign_calls == 2
+
+    def test_presigned_url_cache_separates_dispositions(self) -> None:
+        adapter = DummyS3Adapter()
+        storage = S3ImageStorage(adapter)
+
+        storage.generate_presigned_get_url(key="images/u/img.png", content_disposition="inline")
+        storage.generate_presigned_get_url(key="images/u/img.png", content_disposition="attachment")
+
+        assert adapter.presign_calls == 2
+
+    def test_presigned_url_cache_is_private_to_injected_adapter(self) -> None:
+        first_adapter = DummyS3Adapter()
+        second_adapter = DummyS3Adapter()
+
+        S3ImageStorage(first_adapter).generate_presigned_get_url(key="images/u/img.png")
+        S3ImageStorage(second_adapter).generate_presigned_get_url(key="images/u/img.png")
+
+        assert first_adapter.presign_calls == 1
+        assert second_adapter.presign_calls == 1
+
+    def test_default_storages_share_presigned_url_cache(self, s3_bucket) -> None:
+        assert S3ImageStorage()._presigned_urls is S3ImageStorage()._presigned_urls
+
+    def test_default_storages_share_adapter(self, s3_bucket) -> None:
+        assert S3ImageStorage()._s3 is S3ImageStorage()._s3
+
     def test_upload_image_success(self) -> None:
         storage = S3ImageStorage(DummyS3Adapter())
 
@@ -75,6 +127,23 @@ class TestS3ImageStorage:
         )
         assert key == "images/user_456/img_123.jpg"
 
+    def test_upload_image_async_returns_key(self) -> None:
+        storage = S3ImageStorage(DummyS3Adapter())
+
+        future = storage.upload_image_async(
+            image_id="img_123",
+            user_id="user_456",
+            file_data=b"image-bytes",
+            mime_type="image/png",
+        )
+
+        assert future.result() == "images/user_456/img_123.png"
+        assert future.result() == storage.build_key(
+            image_id="img_123",
+            user_id="user_456",
+            mime_type="image/png",
+        )
+
     def test_upload_image_client_error(self) -> None:
         adapter = DummyS3Adapter(
             put_exc=ClientError(
@@ -116,6 +185,7 @@ class TestS3ImageStorage:
 
         assert key == "images/user_x/img_bin.bin"
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_download_image_success(self) -> None:
         adapter = DummyS3Adapter(
             get_response={
@@ -132,6 +202,52 @@ class TestS3ImageStorage:
         assert content_type == "image/png"
         assert length == 11
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_download_image_closes_stream(self) -> None:
+        body = DummyBody(b"image-bytes")
+        storage = S3ImageStorage(DummyS3Adapter(get_response={"Body": body}))
+
+        storage.download_image(key="images/u/img.png")
+
+        assert body.closed is True
+
+    def test_download_image_is_deprecated(self) -> None:
+        storage = S3ImageStorage(DummyS3Adapter(get_response={"Body": DummyBody(b"abc")}))
+
+        with pytest.warns(DeprecationWarning):
+            storage.download_image(key="images/u/img.png")
+
+    def test_open_image_returns_unread_stream(self) -> None:
+        body = DummyBody(b"image-bytes")
+        adapter = DummyS3Adapter(
+            get_response={
+                "Body": body,
+                "ContentType": "image/png",
+                "ContentLength": 11,
+            }
+        )
+        storage = S3ImageStorage(adapter)
+
+        stream, content_type, length = storage.open_image(key="images/u/img.png")
+
+        assert stream is body
+        assert body.closed is False
+        assert content_type == "image/png"
+        assert length == 11
+
+    def test_open_image_not_found(self) -> None:
+        adapter = DummyS3Adapter(
+            get_exc=ClientError(
+                {"Error": {"Code": "NoSuchKey"}},
+                "GetObject",
+            )
+        )
+        storage = S3ImageStorage(adapter)
+
+        with pytest.raises(NotFoundError):
+            storage.open_image(key="images/missing.png")
+
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_download_image_defaults_when_headers_missing(self) -> None:
         adapter = DummyS3Adapter(
             get_response={
@@ -146,6 +262,7 @@ class TestS3ImageStorage:
         assert content_type == "application/octet-stream"
         assert length == 3
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_download_image_not_found(self) -> None:
         adapter = DummyS3Adapter(
             get_exc=ClientError(
@@ -158,6 +275,7 @@ class TestS3ImageStorage:
         with pytest.raises(NotFoundError):
             storage.download_image(key="images/missing.png")
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_download_image_client_error(self) -> None:
         adapter = DummyS3Adapter(
             get_exc=ClientError(
@@ -170,6 +288,7 @@ class TestS3ImageStorage:
         with pytest.raises(S3Error):
             storage.download_image(key="images/broken.png")
 
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_download_image_unexpected_exception(self) -> None:
         adapter = DummyS3Adapter(get_exc=Exception("boom"))
         storage = S3ImageStorage(adapter)
@@ -182,6 +301,25 @@ class TestS3ImageStorage:
 
         storage.remove_image(key="images/u/img.jpg")
 
+    def test_remove_images_bulk_returns_failed_keys(self) -> None:
+        storage = S3ImageStorage(DummyS3Adapter())
+
+        failed = storage.remove_images_bulk(keys=["images/u/a.jpg", "images/u/b.locked"])
+
+        assert failed == {"images/u/b.locked": "AccessDenied"}
+
+    def test_remove_images_bulk_client_error(self) -> None:
+        adapter = DummyS3Adapter(
+            delete_exc=ClientError(
+                {"Error": {"Code": "AccessDenied"}},
+                "DeleteObjects",
+            )
+        )
+        storage = S3ImageStorage(adapter)
+
+        with pytest.raises(S3Error):
+            storage.remove_images_bulk(keys=["images/u/a.jpg"])
+
     def test_remove_image_client_error(self) -> None:
         adapter = DummyS3Adapter(
             delete_exc=ClientError(
@@ -2,6 +2,8 @@
 Unit tests for core.models.errors
 """
 
+import pytest
+
 from core.models.errors import (
     DuplicateImageError,
     DynamoDBError,
@@ -29,6 +31,15 @@ class TestImageServiceError:
         assert err.error_code == "TEST_ERROR"
         assert err.details == {"foo": "bar"}
 
+    def test_base_error_requires_code(self) -> None:
+        with pytest.raises(TypeError):
+            ImageServiceError(message="Something went wrong")
+
+    def test_explicit_code_overrides_default(self) -> None:
+        err = S3Error(message="Upload failed", error_code="IMAGE_UPLOAD_FAILED")
+
+        assert err.error_code == "IMAGE_UPLOAD_FAILED"
+
 
 class TestValidationError:
     def test_validation_error_defaults(self) -> None:
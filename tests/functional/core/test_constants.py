@@ -0,0 +1,38 @@
+import ast
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from core.utils import constants
+from core.utils.constants import format_file_size
+
+
+@pytest.mark.parametrize(
+    ("size_bytes", "expected"),
+    [
+        (0, "0.0 B"),
+        (1023, "1023.0 B"),
+        (1024, "1.0 KB"),
+        (1536, "1.5 KB"),
+        (1024**2 - 1, "1024.0 KB"),
+        (4 * 1024**2, "4.0 MB"),
+        (3 * 1024**3, "3.0 GB"),
+        (2 * 1024**5, "2048.0 TB"),
+    ],
+)
+def test_format_file_size(size_bytes: int, expected: str) -> None:
+    assert format_file_size(size_bytes) == expected
+
+
+def test_constants_are_declared_once() -> None:
+    tree = ast.parse(Path(constants.__file__).read_text())
+    names = Counter(
+        target.id
+        for node in tree.body
+        if isinstance(node, (ast.Assign, ast.AnnAssign))
+        for target in (node.targets if isinstance(node, ast.Assign) else [node.target])
+        if isinstance(target, ast.Name)
+    )
+
+    assert [name for name, count in names.items() if count > 1] == []
@@ -0,0 +1,37 @@
+import pytest
+
+from core.utils.cursor import decode_cursor, encode_cursor
+
+
+def test_cursor_round_trip() -> None:
+    key = {"image_id": "img_1", "user_id": "john", "created_at": "2024-01-01T10:00:00Z"}
+
+    assert decode_cursor(encode_cursor(key)) == key
+
+
+def test_cursor_is_url_safe() -> None:
+    cursor = encode_cursor({"image_id": "???>>>"})
+
+    assert "+" not in cursor
+    assert "/" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10=", "ü"])
+def test_decode_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        {"image_id": "img_1"},
+        {"image_id": "img_1", "user_id": "john", "created_at": "2024-01-01", "extra": "x"},
+        {"image_id": "img_1", "user_id": "john", "file_hash": "abc"},
+        {"image_id": "img_1", "user_id": {"S": "john"}, "created_at": "2024-01-01"},
+        {"image_id": 1, "user_id": "john", "created_at": "2024-01-01"},
+    ],
+)
+def test_decode_rejects_unexpected_key(key: dict) -> None:
+    with pytest.raises(ValueError):
+        decode_cursor(encode_cursor(key))
@@ -14,3 +14,21 @@ def test_detect_png() -> None:
 def test_unsupported_type() -> None:
     with pytest.raises(ValueError):
         detect_mime_type(b"random-bytes")
+
+
+def test_detect_gif() -> None:
+    assert detect_mime_type(b"GIF89a\x01\x00") == "image/gif"
+
+
+def test_detect_webp() -> None:
+    assert detect_mime_type(b"RIFF\x24\x00\x00\x00WEBPVP8 ") == "image/webp"
+
+
+def test_riff_without_webp_fourcc_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        detect_mime_type(b"RIFF\x24\x00\x00\x00WAVEfmt ")
+
+
+def test_short_input_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        detect_mime_type(b"\xff")
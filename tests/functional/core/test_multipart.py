@@ -0,0 +1,49 @@
+import pytest
+
+from core.utils.multipart import is_multipart, parse_multipart_form
+
+BOUNDARY = "test-boundary"
+CONTENT_TYPE = f"multipart/form-data; boundary={BOUNDARY}"
+
+
+def multipart_body(fields: dict[str, str], files: dict[str, tuple[str, bytes]]) -> bytes:
+    parts: list[bytes] = []
+
+    for name, value in fields.items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'.encode() + value.encode() + b"\r\n"
+        )
+
+    for name, (filename, data) in files.items():
+        parts.append(
+            f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            f"Content-Type: application/octet-stream\r\n\r\n".encode()
+            + data
+            + b"\r\n"
+        )
+
+    return b"".join(parts) + f"--{BOUNDARY}--\r\n".encode()
+
+
+def test_is_multipart() -> None:
+    assert is_multipart(CONTENT_TYPE) is True
+    assert is_multipart("Multipart/Form-Data; boundary=x") is True
+    assert is_multipart("application/json") is False
+    assert is_multipart("") is False
+
+
+def test_parse_text_and_file_fields() -> None:
+    image = b"\x89PNG\r\n\x1a\n\x00\xff--binary\r\n"
+    body = multipart_body(
+        {"user_id": "john", "tags": "a,b"},
+        {"file": ("photo.png", image)},
+    )
+
+    fields = parse_multipart_form(body, CONTENT_TYPE)
+
+    assert fields == {"user_id": "john", "tags": "a,b", "file": image}
+
+
+def test_parse_invalid_body() -> None:
+    with pytest.raises(ValueError):
+        parse_multipart_form(b"not-multipart", CONTENT_TYPE)
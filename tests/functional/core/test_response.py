@@ -1,8 +1,10 @@
 import base64
+from decimal import Decimal
 from http import HTTPStatus
 import json
 from typing import Any, cast
 
+from pydantic import BaseModel
 import pytest
 
 from core.utils.response import ResponseBuilder
@@ -26,6 +28,42 @@ def test_ok_response() -> None:
     assert resp["headers"]["Access-Control-Allow-Origin"] == "*"
 
 
+class _Body(BaseModel):
+    name: str
+    count: int
+
+
+def test_ok_response_from_model() -> None:
+    resp = ResponseBuilder.ok(_Body(name="cat", count=2))
+
+    assert resp["statusCode"] == HTTPStatus.OK
+    assert parse_body(resp) == {"name": "cat", "count": 2}
+
+
+def test_ok_response_from_model_with_request_id() -> None:
+    resp = ResponseBuilder.ok(_Body(name="cat", count=2), request_id="req-1")
+
+    assert parse_body(resp) == {"name": "cat", "count": 2, "request_id": "req-1"}
+
+
+def test_ok_response_encodes_decimals_as_numbers() -> None:
+    resp = ResponseBuilder.ok({"size": Decimal("1024"), "ratio": Decimal("0.5"), "sizes": [Decimal("2")]})
+
+    assert parse_body(resp) == {"size": 1024, "ratio": 0.5, "sizes": [2]}
+
+
+def test_ok_response_rejects_non_finite_decimal() -> None:
+    with pytest.raises(TypeError):
+        ResponseBuilder.ok({"size": Decimal("NaN")})
+
+
+def test_ok_response_keeps_non_ascii_as_utf8() -> None:
+    resp = ResponseBuilder.ok({"image_name": "café.jpg"})
+
+    assert "café.jpg" in resp["body"]
+    assert parse_body(resp) == {"image_name": "café.jpg"}
+
+
 def test_created_response() -> None:
     resp = ResponseBuilder.created({"id": 1})
     parsed = parse_body(resp)
@@ -102,3 +140,23 @@ def test_binary_response() -> None:
     assert resp["isBase64Encoded"] is True
     assert base64.b64decode(resp["body"]) == content
     assert resp["headers"]["Content-Type"] == "image/png"
+
+
+@pytest.mark.parametrize("content_type", ["image/svg+xml", "text/plain; charset=utf-8", "application/json"])
+def test_binary_response_passes_text_through(content_type: str) -> None:
+    content = b"<svg xmlns='http://www.w3.org/2000/svg'/>"
+
+    resp = ResponseBuilder.binary_response(content, content_type=content_type)
+
+    assert resp["isBase64Encoded"] is False
+    assert resp["body"] == content.decode("utf-8")
+    assert resp["headers"]["Content-Length"] == str(len(content))
+
+
+def test_binary_response_encodes_undecodable_text() -> None:
+    content = b"\xff\xfe"
+
+    resp = ResponseBuilder.binary_response(content, content_type="text/plain")
+
+    assert resp["isBase64Encoded"] is True
+    assert base64.b64decode(resp["body"]) == content
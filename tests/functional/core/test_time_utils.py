@@ -1,5 +1,8 @@
 from datetime import datetime, timezone
 
+import pytest
+
+from core.utils import time as time_utils
 from core.utils.time import utc_now_iso
 
 
@@ -30,3 +33,8 @@ class TestUtcNowIso:
         t1 = utc_now_iso()
         t2 = utc_now_iso()
         assert t1 <= t2
+
+    def test_keeps_microseconds_on_whole_seconds(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(time_utils, "_now", lambda tz: datetime(2024, 1, 15, 10, 42, 31, tzinfo=tz))
+
+        assert utc_now_iso() == "2024-01-15T10:42:31.000000+00:00"
@@ -0,0 +1,51 @@
+from core.utils.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    def test_get_returns_value_before_expiry(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, clock=clock)
+
+        cache.set("a", 1)
+        clock.now = 9.9
+
+        assert cache.get("a") == 1
+
+    def test_get_returns_none_after_expiry(self) -> None:
+        clock = FakeClock()
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10, clock=clock)
+
+        cache.set("a", 1)
+        clock.now = 10
+
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=10)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_discard_values(self) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=10)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.discard_values({1})
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
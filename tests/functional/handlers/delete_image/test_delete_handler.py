@@ -69,6 +69,21 @@ class TestDeleteImageHandler:
         assert body["error"] == "NOT_FOUND"
         assert body["message"] == "Image not found: missing"
 
+    def test_delete_dedup_marker_is_not_found(
+        self,
+        aws_mock,
+        lambda_context,
+        dynamodb_table,
+        dynamodb_put_item,
+        s3_bucket,
+    ) -> None:
+        dynamodb_put_item({"image_id": "dedup#john_doe#hash123", "dedup_image_id": "img_abc123"})
+
+        response = handler({"pathParameters": {"image_id": "dedup#john_doe#hash123"}}, lambda_context)
+
+        assert response["statusCode"] == 404
+        assert dynamodb_table.get_item(Key={"image_id": "dedup#john_doe#hash123"}).get("Item") is not None
+
     def test_delete_missing_image_id(self, lambda_context) -> None:
         response = handler({"pathParameters": None}, lambda_context)
 
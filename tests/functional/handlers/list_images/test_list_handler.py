@@ -1,5 +1,6 @@
 import json
 
+from core.utils.cursor import encode_cursor
 from handlers.list_images.handler import handler
 
 
@@ -102,6 +103,76 @@ class TestListImageHandler:
         assert body["returned_count"] == 1
         assert body["pagination"]["has_more"] is False
 
+    def test_list_with_cursor_pagination(
+        self,
+        lambda_context,
+        dynamodb_with_multiple_items,
+    ) -> None:
+        event = {
+            "queryStringParameters": {
+                "user_id": "john",
+                "limit": "1",
+                "pagination": "cursor",
+            }
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+
+        assert body["returned_count"] == 1
+        assert body["pagination"]["has_more"] is True
+        assert body["pagination"]["next_offset"] is None
+
+        next_cursor = body["pagination"]["next_cursor"]
+        event["queryStringParameters"] = {
+            "user_id": "john",
+            "limit": "1",
+            "cursor": next_cursor,
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        second_body = json.loads(response["body"])
+
+        assert second_body["returned_count"] == 1
+        assert second_body["images"][0]["image_id"] != body["images"][0]["image_id"]
+
+    def test_list_invalid_cursor(
+        self,
+        lambda_context,
+        dynamodb_with_multiple_items,
+    ) -> None:
+        event = {
+            "queryStringParameters": {
+                "user_id": "john",
+                "cursor": "not-a-cursor",
+            }
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+
+    def test_list_cursor_for_another_user(
+        self,
+        lambda_context,
+        dynamodb_with_multiple_items,
+    ) -> None:
+        cursor = encode_cursor({"image_id": "img_1", "user_id": "alice", "created_at": "2024-01-01T10:00:00Z"})
+        event = {
+            "queryStringParameters": {
+                "user_id": "john",
+                "cursor": cursor,
+            }
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+
     def test_list_offset_beyond_range(
         self,
         lambda_context,
@@ -135,6 +135,35 @@ class TestListImagesRequest:
                 offset=-1,
             )
 
+    def test_cursor_request_uses_cursor(self) -> None:
+        req = ListImagesRequest(user_id="john_doe", cursor="abc")
+
+        assert req.cursor == "abc"
+        assert req.uses_cursor is True
+
+    def test_default_request_does_not_use_cursor(self) -> None:
+        assert ListImagesRequest(user_id="john_doe").uses_cursor is False
+
+    def test_cursor_pagination_opt_in(self) -> None:
+        assert ListImagesRequest(user_id="john_doe", pagination="cursor").uses_cursor is True
+
+    def test_cursor_pagination_with_offset_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            ListImagesRequest(user_id="john_doe", pagination="cursor", offset=5)
+
+    def test_offset_request_does_not_use_cursor(self) -> None:
+        req = ListImagesRequest(user_id="john_doe", offset=5)
+
+        assert req.uses_cursor is False
+
+    def test_cursor_with_offset_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            ListImagesRequest(user_id="john_doe", cursor="abc", offset=5)
+
+    def test_cursor_with_name_sort_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            ListImagesRequest(user_id="john_doe", cursor="abc", sort_by="image_name")
+
     def test_explicit_sorting_valid(self) -> None:
         req = ListImagesRequest(
             user_id="john_doe",
@@ -1,5 +1,7 @@
 import base64
+import hashlib
 import json
+import os
 from unittest.mock import patch
 
 from core.models.errors import (
@@ -22,13 +24,8 @@ def large_png_bytes() -> bytes:
 
 
 class TestUploadHandler:
-    @patch(
-        "handlers.upload_image.service.DynamoDBMetadata.check_duplicate_image",
-        return_value=False,
-    )
     def test_upload_success(
         self,
-        mock_duplicate,
         aws_mock,
         lambda_context,
         dynamodb_table,
@@ -55,6 +52,52 @@ class TestUploadHandler:
         assert body["s3_key"].startswith("images/user_1/")
         assert body["message"] == "Image uploaded successfully"
 
+    def test_upload_multipart_success(
+        self,
+        aws_mock,
+        lambda_context,
+        dynamodb_table,
+        s3_bucket,
+        s3_get_object,
+    ) -> None:
+        boundary = "test-boundary"
+        multipart = (
+            (
+                f'--{boundary}\r\nContent-Disposition: form-data; name="user_id"\r\n\r\nuser_1\r\n'
+                f'--{boundary}\r\nContent-Disposition: form-data; name="image_name"\r\n\r\nphoto.png\r\n'
+                f'--{boundary}\r\nContent-Disposition: form-data; name="tags"\r\n\r\nnature,sky\r\n'
+                f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="photo.png"\r\n'
+                f"Content-Type: application/octet-stream\r\n\r\n"
+            ).encode()
+            + valid_png_bytes()
+            + f"\r\n--{boundary}--\r\n".encode()
+        )
+
+        event = {
+            "headers": {"content-type": f"multipart/form-data; boundary={boundary}"},
+            "body": base64.b64encode(multipart).decode(),
+            "isBase64Encoded": True,
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 201
+        body = json.loads(response["body"])
+
+        assert body["user_id"] == "user_1"
+        assert body["image_name"] == "photo.png"
+        assert s3_get_object(body["s3_key"]) == valid_png_bytes()
+
+    def test_upload_invalid_multipart(self, lambda_context) -> None:
+        event = {
+            "headers": {"Content-Type": "multipart/form-data; boundary=x"},
+            "body": "garbage",
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+
     def test_upload_duplicate_image(
         self,
         lambda_context,
@@ -79,6 +122,67 @@ class TestUploadHandler:
         body = json.loads(response["body"])
         assert body["error"] == "DUPLICATE_IMAGE_ERROR"
 
+    def test_upload_same_content_twice_is_rejected(
+        self,
+        aws_mock,
+        lambda_context,
+        dynamodb_table,
+        s3_bucket,
+    ) -> None:
+        event = {
+            "body": json.dumps(
+                {
+                    "file": base64.b64encode(valid_png_bytes()).decode(),
+                    "user_id": "user_1",
+                    "image_name": "photo.png",
+                }
+            )
+        }
+
+        first = handler(event, lambda_context)
+        second = handler(event, lambda_context)
+
+        assert first["statusCode"] == 201
+        assert second["statusCode"] == 422
+        assert json.loads(second["body"])["error"] == "DUPLICATE_IMAGE_ERROR"
+
+    def test_upload_matching_unmarked_image_is_rejected(
+        self,
+        aws_mock,
+        lambda_context,
+        dynamodb_table,
+        dynamodb_put_item,
+        s3_bucket,
+        monkeypatch,
+    ) -> None:
+        monkeypatch.setattr("core.infrastructure.aws.dynamodb_metadata.LEGACY_DUPLICATE_CHECK", True)
+        # Stored before dedup markers existed, so it has no marker item
+        dynamodb_put_item(
+            {
+                "image_id": "img_legacy",
+                "user_id": "user_1",
+                "image_name": "old.png",
+                "created_at": "2024-01-01T10:00:00Z",
+                "file_hash": hashlib.sha256(valid_png_bytes()).hexdigest(),
+            }
+        )
+        event = {
+            "body": json.dumps(
+                {
+                    "file": base64.b64encode(valid_png_bytes()).decode(),
+                    "user_id": "user_1",
+                    "image_name": "photo.png",
+                }
+            )
+        }
+
+        response = handler(event, lambda_context)
+
+        assert response["statusCode"] == 422
+        assert json.loads(response["body"])["error"] == "DUPLICATE_IMAGE_ERROR"
+        assert [item["image_id"] for item in dynamodb_table.scan()["Items"]] == ["img_legacy"]
+        assert "Contents" not in s3_bucket.list_objects_v2(Bucket=os.environ["IMAGE_S3_BUCKET_NAME"])
+
     def test_upload_invalid_base64(self, lambda_context) -> None:
         event = {
             "body": json.dumps(
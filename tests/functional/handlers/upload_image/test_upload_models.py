@@ -63,6 +63,18 @@ class TestUploadModels:
         with pytest.raises(ValidationError):
             ImageUploadRequest(**valid_payload(file=empty_b64))
 
+    def test_raw_bytes_file_allowed(self) -> None:
+        req = ImageUploadRequest(**valid_payload(file=b"\x89PNG\r\n\x1a\nraw"))
+        assert req.file == b"\x89PNG\r\n\x1a\nraw"
+
+    def test_empty_raw_bytes_file(self) -> None:
+        with pytest.raises(ValidationError):
+            ImageUploadRequest(**valid_payload(file=b""))
+
+    def test_raw_bytes_file_size_exceeded(self) -> None:
+        with pytest.raises(ValidationError):
+            ImageUploadRequest(**valid_payload(file=b"a" * (MAX_FILE_SIZE + 1)))
+
     def test_file_size_exact_limit_allowed(self) -> None:
         req = ImageUploadRequest(**valid_payload(file=b64(b"a" * MAX_FILE_SIZE)))
         assert req is not None
@@ -40,9 +40,8 @@ class TestUploadService:
         service = UploadService()
 
         with (
-            patch.object(service.metadata, "check_duplicate_image", return_value=False),
             patch.object(service.storage, "upload_image", return_value="images/u/img.png"),
-            patch.object(service.metadata, "create_metadata"),
+            patch.object(service.metadata, "create_metadata_atomic_dedup"),
         ):
             result = service.upload_image(
                 user_id="user_1",
@@ -55,7 +54,7 @@ class TestUploadService:
         assert result["user_id"] == "user_1"
         assert result["image_name"] == "photo.png"
         assert result["mime_type"] == "image/png"
-        assert result["s3_key"] == "images/u/img.png"
+        assert result["s3_key"] == f"images/user_1/{result['image_id']}.png"
         assert result["file_size"] > 0
         assert "created_at" in result
         assert "file_hash" in result
@@ -89,10 +88,32 @@ class TestUploadService:
     def test_upload_duplicate_image_same_user(self, mock_detect) -> None:
         service = UploadService()
 
-        with patch.object(
-            service.metadata,
-            "check_duplicate_image",
-            return_value=True,
+        with (
+            patch.object(service.storage, "upload_image", return_value="images/u/img.png"),
+            patch.object(
+                service.metadata,
+                "create_metadata_atomic_dedup",
+                side_effect=DuplicateImageError(message="This image already exists"),
+            ),
+            patch.object(service.storage, "remove_image") as mock_cleanup,
+        ):
+            with pytest.raises(DuplicateImageError):
+                service.upload_image(
+                    user_id="user_1",
+                    image_name="photo.png",
+                    file_data=fake_image_bytes(),
+                )
+
+        mock_cleanup.assert_called_once()
+
+    @patch("handlers.upload_image.service.detect_mime_type", return_value="image/png")
+    def test_known_duplicate_rejected_before_upload(self, mock_detect) -> None:
+        service = UploadService()
+
+        with (
+            patch.object(service.metadata, "is_known_duplicate", return_value=True),
+            patch.object(service.storage, "upload_image_async") as mock_upload,
+            patch.object(service.metadata, "create_metadata_atomic_dedup_async") as mock_create,
         ):
             with pytest.raises(DuplicateImageError):
                 service.upload_image(
@@ -101,12 +122,14 @@ class TestUploadService:
                     file_data=fake_image_bytes(),
                 )
 
+        mock_upload.assert_not_called()
+        mock_create.assert_not_called()
+
     @patch("handlers.upload_image.service.detect_mime_type", return_value="image/png")
     def test_upload_s3_failure(self, mock_detect) -> None:
         service = UploadService()
 
         with (
-            patch.object(service.metadata, "check_duplicate_image", return_value=False),
             patch.object(
                 service.storage,
                 "upload_image",
@@ -120,16 +143,37 @@ class TestUploadService:
                     file_data=fake_image_bytes(),
                 )
 
+    @patch("handlers.upload_image.service.detect_mime_type", return_value="image/png")
+    def test_s3_failure_triggers_metadata_cleanup(self, mock_detect) -> None:
+        service = UploadService()
+
+        with (
+            patch.object(
+                service.storage,
+                "upload_image",
+                side_effect=Exception("S3 down"),
+            ),
+            patch.object(service.metadata, "create_metadata_atomic_dedup"),
+            patch.object(service.metadata, "remove_metadata") as mock_cleanup,
+        ):
+            with pytest.raises(S3Error):
+                service.upload_image(
+                    user_id="user_1",
+                    image_name="photo.png",
+                    file_data=fake_image_bytes(),
+                )
+
+        mock_cleanup.assert_called_once()
+
     @patch("handlers.upload_image.service.detect_mime_type", return_value="image/png")
     def test_db_failure_triggers_s3_cleanup(self, mock_detect) -> None:
         service = UploadService()
 
         with (
-            patch.object(service.metadata, "check_duplicate_image", return_value=False),
             patch.object(service.storage, "upload_image", return_value="images/u/img.png"),
             patch.object(
                 service.metadata,
-                "create_metadata",
+                "create_metadata_atomic_dedup",
                 side_effect=Exception("DB down"),
             ),
             patch.object(service.storage, "remove_image") as mock_cleanup,
@@ -148,11 +192,10 @@ class TestUploadService:
         service = UploadService()
 
         with (
-            patch.object(service.metadata, "check_duplicate_image", return_value=False),
             patch.object(service.storage, "upload_image", return_value="images/u/img.png"),
             patch.object(
                 service.metadata,
-                "create_metadata",
+                "create_metadata_atomic_dedup",
                 side_effect=Exception("DB down"),
             ),
             patch.object(